@@ -0,0 +1,528 @@
+import asyncio
+import os
+import random
+import tempfile
+import time
+from array import array
+
+from tasks.problem_1_merge_sort import MergeSort, np
+from tasks.problem_1_parallel_sort import ParallelMergeSort
+from tasks.problem_2_batch_paths import BatchShortestPaths
+from tasks.problem_2_contraction_hierarchies import ContractionHierarchy
+from tasks.problem_2_dijkstras_algorithm import (
+    CSRGraph,
+    DijkstraAlgorithm,
+    FrozenGraph,
+    Landmarks,
+)
+from tasks.problem_2_query_server import ShortestPathServer, load_test
+from tasks.problem_3_batch_sudoku import BatchSudoku
+from tasks.problem_3_sudoku_generator import DIFFICULTIES, SudokuGenerator
+from tasks.problem_3_sudoku_solver import Sudoku, format_puzzle, parse_puzzle
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    # Run func a few times and keep the best wall time, the best run has the least noise
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_merge_sort(size: int = 200_000) -> None:
+    random_arr = [random.randint(0, size) for _ in range(size)]
+
+    # Sorted data with 1% of the elements overwritten, like appended logs with a few stragglers
+    nearly_sorted_arr = list(range(size))
+    for _ in range(size // 100):
+        nearly_sorted_arr[random.randrange(size)] = random.randint(0, size)
+
+    sorter = MergeSort()
+    for name, arr in (("random", random_arr), ("nearly sorted", nearly_sorted_arr)):
+        print(f"=== Merge Sort strategies ({size} {name} integers) ===")
+        expected = sorted(arr)
+        for strategy in ("recursive", "bottom_up", "adaptive"):
+            if sorter.sort_copy(arr, strategy) != expected:
+                print(f"{strategy:>12}: WRONG RESULT")
+                continue
+            elapsed = time_call(sorter.sort_copy, arr, strategy)
+            print(f"{strategy:>12}: {elapsed * 1000:.1f} ms")
+
+        # sort_buffer works in place, so every timed run gets a fresh int64 array
+        typed = array("q", arr)
+        sorter.sort_buffer(typed)
+        if list(typed) != expected:
+            print(f"{'buffer':>12}: WRONG RESULT")
+        else:
+            elapsed = time_call(lambda: sorter.sort_buffer(array("q", arr)))
+            engine = "NumPy" if np is not None else "pure Python"
+            print(f"{'buffer':>12}: {elapsed * 1000:.1f} ms ({engine})")
+
+        parallel_sorter = ParallelMergeSort()
+        if parallel_sorter.sort_copy(arr) != expected:
+            print(f"{'parallel':>12}: WRONG RESULT")
+        else:
+            elapsed = time_call(parallel_sorter.sort_copy, arr)
+            print(
+                f"{'parallel':>12}: {elapsed * 1000:.1f} ms ({parallel_sorter.workers} workers)"
+            )
+        print()
+
+
+def random_graph(
+    vertices: int, edges_per_vertex: int, max_weight: int = 100
+) -> dict[str, list[tuple[str, int]]]:
+    # A random directed graph in the dict form, every vertex gets edges_per_vertex distinct edges
+    names = [f"V{i}" for i in range(vertices)]
+    graph: dict[str, list[tuple[str, int]]] = {}
+    for name in names:
+        destinations = random.sample(names, min(edges_per_vertex, vertices))
+        graph[name] = [(dest, random.randint(0, max_weight)) for dest in destinations]
+    return graph
+
+
+def grid_graph(side: int, max_weight: int = 10) -> dict[str, list[tuple[str, int]]]:
+    # A road-like side x side grid where every cell has an edge to each of its 4 neighbours
+    graph: dict[str, list[tuple[str, int]]] = {}
+    for row in range(side):
+        for col in range(side):
+            edges = []
+            for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                r, c = row + d_row, col + d_col
+                if 0 <= r < side and 0 <= c < side:
+                    edges.append((f"{r},{c}", random.randint(1, max_weight)))
+            graph[f"{row},{col}"] = edges
+    return graph
+
+
+def chain_graph(length: int, weight: int) -> dict[str, list[tuple[str, int]]]:
+    # A single path V0 -> V1 -> ... with every edge the same weight, the deepest graph there is
+    graph = {f"V{i}": [(f"V{i + 1}", weight)] for i in range(length - 1)}
+    graph[f"V{length - 1}"] = []
+    return graph
+
+
+def benchmark_dijkstra_queues(
+    vertices: int = 50_000, edges_per_vertex: int = 8, chain_length: int = 2000
+) -> None:
+    # Small weights suit Dial's buckets, large ones leave only the heaps and the radix heap.
+    # The chain is the worst case for Dial: its cursor walks weight x length distances.
+    cases = [
+        (
+            f"{vertices} vertices, {vertices * edges_per_vertex} edges, "
+            f"weights up to {max_weight}",
+            CSRGraph.from_dict(random_graph(vertices, edges_per_vertex, max_weight)),
+        )
+        for max_weight in (10, 100, 1_000_000)
+    ]
+    cases.append(
+        (
+            f"chain of {chain_length} vertices, weights 1000",
+            CSRGraph.from_dict(chain_graph(chain_length, 1000)),
+        )
+    )
+
+    for title, graph in cases:
+        print(f"=== Dijkstra priority queues ({title}) ===")
+        source = graph.names[0]
+
+        expected = None
+        for label, solver in (
+            ("lazy MinHeap", DijkstraAlgorithm("lazy")),
+            ("indexed 2-ary", DijkstraAlgorithm("indexed", 2)),
+            ("indexed 4-ary", DijkstraAlgorithm("indexed", 4)),
+            ("Dial buckets", DijkstraAlgorithm("dial")),
+            ("radix heap", DijkstraAlgorithm("radix")),
+        ):
+            # A million buckets per lap of the cursor would take minutes
+            if solver.queue == "dial" and graph.max_weight > 100_000:
+                continue
+            distances = solver.solve_with_paths(graph, source)[0]
+            if expected is None:
+                expected = distances
+            elif distances != expected:
+                print(f"{label:>14}: WRONG RESULT")
+                continue
+            elapsed = time_call(solver._dijkstra, graph, 0)
+            print(f"{label:>14}: {elapsed * 1000:.1f} ms")
+
+        print(f"(automatic choice: {DijkstraAlgorithm()._choose_queue(graph)})")
+        print()
+
+
+def benchmark_point_to_point(side: int = 300, queries: int = 20) -> None:
+    print(
+        f"=== Point-to-point queries ({side}x{side} grid, {queries} local queries) ==="
+    )
+    graph = CSRGraph.from_dict(grid_graph(side))
+    solver = DijkstraAlgorithm()
+
+    # Local queries: the destination is a few cells away from the source
+    pairs = []
+    for _ in range(queries):
+        row, col = random.randrange(side - 10), random.randrange(side - 10)
+        pairs.append((f"{row},{col}", f"{row + random.randint(0, 9)},{col + 9}"))
+
+    def run_full() -> None:
+        for source, _ in pairs:
+            solver._dijkstra(graph, graph.index[source])
+
+    settled_full = 0
+    for source, _ in pairs:
+        solver._dijkstra(graph, graph.index[source])
+        settled_full += solver.last_settled
+    elapsed = time_call(run_full, repeat=1)
+    print(
+        f"{'full solve':>14}: {elapsed * 1000:.1f} ms, {settled_full // queries} settled per query"
+    )
+
+    start = time.perf_counter()
+    landmarks = Landmarks.build(graph, count=8)
+    print(
+        f"(ALT preprocessing with 8 landmarks took {time.perf_counter() - start:.1f} s)"
+    )
+
+    def run(method: str, heuristic: Landmarks | None) -> None:
+        for source, destination in pairs:
+            solver.get_path(graph, source, destination, method, heuristic)
+
+    for label, method, heuristic in (
+        ("dijkstra", "dijkstra", None),
+        ("bidirectional", "bidirectional", None),
+        ("ALT", "astar", landmarks),
+    ):
+        settled = 0
+        for source, destination in pairs:
+            solver.get_path(graph, source, destination, method, heuristic)
+            settled += solver.last_settled
+        elapsed = time_call(run, method, heuristic, repeat=1)
+        print(
+            f"{label:>14}: {elapsed * 1000:.1f} ms, {settled // queries} settled per query"
+        )
+
+
+def benchmark_contraction_hierarchies(side: int = 100, queries: int = 100) -> None:
+    print(
+        f"=== Contraction Hierarchies ({side}x{side} grid, {queries} random queries) ==="
+    )
+    graph = CSRGraph.from_dict(grid_graph(side))
+    solver = DijkstraAlgorithm()
+
+    start = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(graph)
+    build_time = time.perf_counter() - start
+    shortcuts = sum(
+        middle != -1 for middle in hierarchy.up_middle + hierarchy.down_middle
+    )
+    print(
+        f"{'build':>14}: {build_time:.1f} s, {shortcuts} shortcuts "
+        f"on top of {graph.edge_count} edges"
+    )
+
+    pairs = [
+        (random.randrange(graph.vertex_count), random.randrange(graph.vertex_count))
+        for _ in range(queries)
+    ]
+
+    def dijkstra_query(source: int, target: int) -> int:
+        solver._dijkstra(graph, source, target=target)
+        return solver.last_settled
+
+    def hierarchy_query(source: int, target: int) -> int:
+        hierarchy.query(source, target)
+        return hierarchy.last_settled
+
+    def run(query) -> int:
+        return sum(query(source, target) for source, target in pairs)
+
+    for label, query in (("dijkstra", dijkstra_query), ("CH", hierarchy_query)):
+        settled = run(query)
+        elapsed = time_call(run, query, repeat=1)
+        print(
+            f"{label:>14}: {elapsed * 1000:.1f} ms, {settled // queries} settled per query"
+        )
+
+
+def benchmark_graph_types(side: int = 300, queries: int = 20) -> None:
+    print(
+        f"=== Graph input types ({side}x{side} grid, {queries} local queries per method) ==="
+    )
+    graph = grid_graph(side)
+    csr = CSRGraph.from_dict(graph)
+    frozen = FrozenGraph.freeze(csr)
+    solver = DijkstraAlgorithm()
+
+    pairs = []
+    for _ in range(queries):
+        row, col = random.randrange(side - 10), random.randrange(side - 10)
+        pairs.append((f"{row},{col}", f"{row + random.randint(0, 9)},{col + 9}"))
+
+    # Local queries settle few vertices, so the per-call conversion and validation dominate
+    def run(query_graph, method: str) -> None:
+        for source, destination in pairs:
+            solver.get_path(query_graph, source, destination, method)
+
+    for method in ("dijkstra", "bidirectional"):
+        for label, query_graph in (
+            ("dict", graph),
+            ("CSRGraph", csr),
+            ("FrozenGraph", frozen),
+        ):
+            elapsed = time_call(run, query_graph, method, repeat=1)
+            print(f"{method:>13} {label:>11}: {elapsed * 1000:.1f} ms")
+
+
+def benchmark_batch_paths(
+    side: int = 100, sources: int = 64, facilities: int = 16
+) -> None:
+    print(
+        f"=== Batched shortest paths ({side}x{side} grid, {sources} sources, "
+        f"{facilities} facilities) ==="
+    )
+    graph = CSRGraph.from_dict(grid_graph(side))
+    solver = DijkstraAlgorithm()
+    batch = BatchShortestPaths(graph)
+    chosen = random.sample(graph.names, sources)
+
+    def run_loop() -> None:
+        for source in chosen:
+            solver._dijkstra(graph, graph.index[source])
+
+    elapsed = time_call(run_loop, repeat=1)
+    print(f"{'one by one':>14}: {elapsed * 1000:.1f} ms")
+    elapsed = time_call(batch.distance_matrix, chosen, repeat=1)
+    print(f"{'process pool':>14}: {elapsed * 1000:.1f} ms ({batch.workers} workers)")
+
+    # Nearest facility: one search per facility against a single multi-source search
+    sites = random.sample(graph.names, facilities)
+
+    def run_per_facility() -> None:
+        for site in sites:
+            solver._dijkstra(graph, graph.index[site])
+
+    elapsed = time_call(run_per_facility, repeat=1)
+    print(f"{'per facility':>14}: {elapsed * 1000:.1f} ms")
+    elapsed = time_call(solver.nearest_facility, graph, sites, repeat=1)
+    print(f"{'super source':>14}: {elapsed * 1000:.1f} ms")
+
+
+def benchmark_graph_loading(vertices: int = 100_000, edges: int = 1_000_000) -> None:
+    print(f"=== Graph loading ({vertices} vertices, {edges} edges) ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        edge_path = os.path.join(work_dir, "edges.txt")
+        with open(edge_path, "w") as file:
+            for _ in range(edges):
+                file.write(
+                    f"V{random.randrange(vertices)} V{random.randrange(vertices)} "
+                    f"{random.randint(0, 100)}\n"
+                )
+
+        start = time.perf_counter()
+        graph = CSRGraph.from_edge_list(edge_path)
+        print(f"{'edge list':>14}: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        snapshot_path = os.path.join(work_dir, "graph.bin")
+        graph.save(snapshot_path)
+        for label, memory_map in (("snapshot", False), ("mapped", True)):
+            elapsed = time_call(CSRGraph.load, snapshot_path, memory_map)
+            print(f"{label:>14}: {elapsed * 1000:.1f} ms")
+
+
+def benchmark_query_server(
+    side: int = 100, requests: int = 2000, hot_sources: int = 20, connections: int = 32
+) -> None:
+    print(
+        f"=== Query server ({side}x{side} grid, {requests} requests from "
+        f"{hot_sources} sources over {connections} connections) ==="
+    )
+    graph = CSRGraph.from_dict(grid_graph(side))
+    sources = random.sample(graph.names, hot_sources)
+    queries = [
+        {"source": random.choice(sources), "target": random.choice(graph.names)}
+        for _ in range(requests)
+    ]
+
+    async def run() -> None:
+        server = ShortestPathServer(graph)
+        await server.start(port=0)
+        port = server._server.sockets[0].getsockname()[1]
+        try:
+            stats = await load_test(queries, port=port, connections=connections)
+        finally:
+            await server.close()
+        print(
+            f"p50 {stats['p50'] * 1000:.1f} ms, p99 {stats['p99'] * 1000:.1f} ms, "
+            f"{stats['throughput']:.0f} requests/s"
+        )
+        print(
+            f"{server.searches} searches run, {server.coalesced} requests shared a search"
+        )
+
+    asyncio.run(run())
+
+
+# Puzzles that take plain backtracking from a fraction of a second to several seconds
+HARD_SUDOKUS = [
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "120400300300010050006000100700090000040603000003002000500080700007000005000000098",
+]
+
+
+def random_sudoku(box_size: int, clues: float) -> list[list[int]]:
+    # A shuffled full board with roughly the given fraction of cells kept, not always unique
+    side = box_size * box_size
+    values = random.sample(range(1, side + 1), side)
+    rows = [
+        band * box_size + row
+        for band in random.sample(range(box_size), box_size)
+        for row in random.sample(range(box_size), box_size)
+    ]
+    cols = [
+        stack * box_size + col
+        for stack in random.sample(range(box_size), box_size)
+        for col in random.sample(range(box_size), box_size)
+    ]
+    # The pattern shifts every row of a band by one box and every band by one cell
+    return [
+        [
+            (
+                values[(box_size * (row % box_size) + row // box_size + col) % side]
+                if random.random() < clues
+                else 0
+            )
+            for col in cols
+        ]
+        for row in rows
+    ]
+
+
+def benchmark_sudoku_engines() -> None:
+    print(f"=== Sudoku engines ({len(HARD_SUDOKUS)} hard puzzles) ===")
+    puzzles = [parse_puzzle(line) for line in HARD_SUDOKUS]
+    for number, puzzle in enumerate(puzzles, 1):
+        expected = None
+        for engine in ("backtracking", "bitmask", "propagate", "dlx"):
+            solver = Sudoku(engine)
+            solution = solver.solve(puzzle)
+            if expected is None:
+                expected = solution
+            elif solution != expected:
+                print(f"puzzle {number} {engine:>12}: WRONG RESULT")
+                continue
+            elapsed = time_call(solver.solve, puzzle, repeat=1)
+            statistics = (
+                f", {solver.nodes} nodes, {solver.backtracks} backtracks"
+                if engine != "backtracking"
+                else ""
+            )
+            print(f"puzzle {number} {engine:>12}: {elapsed * 1000:.1f} ms{statistics}")
+
+    random.seed(7)
+    for box_size, clues in ((4, 0.4), (5, 0.55)):
+        side = box_size * box_size
+        print(f"\n=== {side}x{side} Sudoku ({clues:.0%} of the cells given) ===")
+        for number in range(1, 4):
+            puzzle = random_sudoku(box_size, clues)
+            for engine in ("propagate", "dlx"):
+                solver = Sudoku(engine)
+                elapsed = time_call(solver.solve, puzzle, repeat=1)
+                print(
+                    f"puzzle {number} {engine:>12}: {elapsed * 1000:.1f} ms, "
+                    f"{solver.nodes} nodes, {solver.backtracks} backtracks"
+                )
+
+
+def benchmark_batch_sudoku(puzzles: int = 20_000) -> None:
+    print(f"=== Batch Sudoku ({puzzles} puzzles, one in a hundred hard) ===")
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, "puzzles.txt")
+        with open(input_path, "w") as file:
+            for number in range(puzzles):
+                if number % 100 == 0:
+                    file.write(random.choice(HARD_SUDOKUS) + "\n")
+                else:
+                    file.write(format_puzzle(random_sudoku(3, 0.4)) + "\n")
+
+        outputs = []
+        for workers in (1, os.cpu_count() or 1):
+            output_path = os.path.join(work_dir, f"solved_{workers}.txt")
+            stats = BatchSudoku(workers=workers).solve_file(input_path, output_path)
+            with open(output_path) as file:
+                outputs.append(file.read())
+            print(
+                f"{workers:>2} workers: {stats['throughput']:.0f} puzzles/s, "
+                f"p50 {stats['p50'] * 1000:.2f} ms, p99 {stats['p99'] * 1000:.2f} ms, "
+                f"max {stats['max'] * 1000:.1f} ms, {stats['solved']} solved"
+            )
+        if outputs[0] != outputs[-1]:
+            print("Outputs differ between worker counts!")
+
+
+def benchmark_sudoku_generator(seconds: float = 10.0) -> None:
+    print(f"=== Sudoku generator ({seconds:.0f} s per setting) ===")
+    checker = Sudoku()
+    for difficulty in (None, *DIFFICULTIES):
+        generator = SudokuGenerator(seed=1)
+        puzzles = []
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            puzzles.append(generator.generate(difficulty=difficulty)[0])
+        elapsed = time.perf_counter() - start
+
+        clues = sum(value != 0 for puzzle in puzzles for row in puzzle for value in row)
+        unique = sum(checker.has_unique_solution(puzzle) for puzzle in puzzles)
+        print(
+            f"{difficulty or 'any':>8}: {len(puzzles) / elapsed * 60:.0f} puzzles/min, "
+            f"{clues / len(puzzles):.1f} clues on average, "
+            f"{generator.searches / len(puzzles):.1f} searches per puzzle, "
+            f"{unique}/{len(puzzles)} unique"
+        )
+
+
+if __name__ == "__main__":
+    print("DSA Assignment - Benchmarks")
+    print("1. Merge Sort strategies")
+    print("2. Dijkstra priority queues")
+    print("3. Dijkstra point-to-point queries")
+    print("4. Contraction Hierarchies")
+    print("5. Graph input types")
+    print("6. Batched shortest paths")
+    print("7. Graph loading")
+    print("8. Query server")
+    print("9. Sudoku engines")
+    print("10. Batch Sudoku")
+    print("11. Sudoku generator")
+
+    try:
+        choice = int(input("Enter benchmark number to run (1-11): "))
+        print()
+
+        if choice == 1:
+            benchmark_merge_sort()
+        elif choice == 2:
+            benchmark_dijkstra_queues()
+        elif choice == 3:
+            benchmark_point_to_point()
+        elif choice == 4:
+            benchmark_contraction_hierarchies()
+        elif choice == 5:
+            benchmark_graph_types()
+        elif choice == 6:
+            benchmark_batch_paths()
+        elif choice == 7:
+            benchmark_graph_loading()
+        elif choice == 8:
+            benchmark_query_server()
+        elif choice == 9:
+            benchmark_sudoku_engines()
+        elif choice == 10:
+            benchmark_batch_sudoku()
+        elif choice == 11:
+            benchmark_sudoku_generator()
+        else:
+            print("Invalid choice. Please enter a valid benchmark number.")
+    except ValueError:
+        print("Invalid input. Please enter a valid benchmark number.")
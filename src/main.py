@@ -1,5 +1,9 @@
+from tasks.problem_1_external_sort import external_sort
 from tasks.problem_1_merge_sort import problem_1
 from tasks.problem_2_dijkstras_algorithm import problem_2
+from tasks.problem_2_query_server import query_server
+from tasks.problem_3_batch_sudoku import batch_sudoku
+from tasks.problem_3_sudoku_generator import generate_puzzles
 from tasks.problem_3_sudoku_solver import problem_3
 
 
@@ -8,9 +12,13 @@ if __name__ == "__main__":
     print("1. Run Problem 1")
     print("2. Run Problem 2")
     print("3. Run Problem 3")
+    print("4. Problem 1: External sort of a large integer file")
+    print("5. Problem 2: Shortest path query server")
+    print("6. Problem 3: Batch Sudoku solver")
+    print("7. Problem 3: Sudoku puzzle generator")
 
     try:
-        choice = int(input("Enter problem number to run (1-3): "))
+        choice = int(input("Enter problem number to run (1-7): "))
         print()
 
         if choice == 1:
@@ -19,7 +27,15 @@ if __name__ == "__main__":
             problem_2()
         elif choice == 3:
             problem_3()
+        elif choice == 4:
+            external_sort()
+        elif choice == 5:
+            query_server()
+        elif choice == 6:
+            batch_sudoku()
+        elif choice == 7:
+            generate_puzzles()
         else:
-            print("Invalid choice. Please enter a number between 1 and 3.")
+            print("Invalid choice. Please enter a number between 1 and 7.")
     except ValueError:
-        print("Invalid input. Please enter a number between 1 and 3.")
+        print("Invalid input. Please enter a number between 1 and 7.")
@@ -0,0 +1,198 @@
+import os
+import tempfile
+from array import array
+from typing import Iterator
+
+from tasks.problem_1_merge_sort import MergeSort
+
+# Runs are spilled as raw signed 64-bit integers, 8 bytes each instead of text or pickled objects
+ITEM_CODE = "q"
+ITEM_SIZE = array(ITEM_CODE).itemsize
+
+# Rough cost of one element while a chunk is sorted in memory:
+# the list slot and the int object itself, plus the slot in the merge sort's scratch buffer
+BYTES_PER_ELEMENT = 64
+
+# How many values are collected before they are written out in one go
+WRITE_BATCH = 8192
+
+
+class ExternalMergeSort:
+    """
+    Sorts files of whitespace separated integers that do not fit in memory.
+    The input is read in chunks that fit the memory budget, each chunk is sorted with MergeSort
+    and spilled to a temporary binary run file, and the runs are then merged with a loser tree.
+    If there are more runs than fan_in, intermediate merge passes reduce them first.
+    SOURCE: https://en.wikipedia.org/wiki/External_sorting
+    """
+
+    def __init__(
+        self,
+        memory_budget: int = 64 * 1024 * 1024,
+        fan_in: int = 64,
+        strategy: str = "adaptive",
+        temp_dir: str | None = None,
+    ) -> None:
+        if memory_budget <= 0:
+            raise ValueError("Memory budget must be a positive number of bytes.")
+        if fan_in < 2:
+            raise ValueError("Merge fan-in must be at least 2.")
+
+        self.memory_budget = memory_budget
+        self.fan_in = fan_in
+        self.strategy = strategy
+        self.temp_dir = temp_dir
+        self.sorter = MergeSort()
+
+        # Number of integers sorted in memory at once, and the size of each text read
+        self.run_length = max(1, memory_budget // BYTES_PER_ELEMENT)
+        self.read_size = max(1, min(memory_budget // 8, 1024 * 1024))
+
+    def sort_file(self, input_path: str, output_path: str) -> int:
+        # Sort input_path into output_path (one integer per line) and return how many were sorted
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as work_dir:
+            runs, count = self._create_runs(input_path, work_dir)
+
+            # Merge groups of fan_in runs into bigger runs until one final merge can take all of them
+            merge_pass = 0
+            while len(runs) > self.fan_in:
+                runs = self._merge_pass(runs, work_dir, merge_pass)
+                merge_pass += 1
+
+            with open(output_path, "w") as output:
+                batch: list[str] = []
+                for value in self._merge_runs(runs):
+                    batch.append(str(value))
+                    if len(batch) >= WRITE_BATCH:
+                        output.write("\n".join(batch))
+                        output.write("\n")
+                        batch = []
+                if batch:
+                    output.write("\n".join(batch))
+                    output.write("\n")
+
+        return count
+
+    def _read_integers(self, input_path: str) -> Iterator[list[int]]:
+        # Yield the integers of the file a block at a time, never holding more than read_size characters
+        carry = ""
+        with open(input_path, "r") as file:
+            while True:
+                text = file.read(self.read_size)
+                if not text:
+                    break
+
+                tokens = (carry + text).split()
+                # The last token may continue in the next block unless the block ended on whitespace
+                carry = "" if text[-1].isspace() or not tokens else tokens.pop()
+                if tokens:
+                    yield [int(token) for token in tokens]
+
+        if carry:
+            yield [int(carry)]
+
+    def _create_runs(self, input_path: str, work_dir: str) -> tuple[list[str], int]:
+        # Split the input into sorted run files of at most run_length integers each
+        runs: list[str] = []
+        count = 0
+        chunk: list[int] = []
+
+        for block in self._read_integers(input_path):
+            chunk.extend(block)
+            count += len(block)
+            while len(chunk) >= self.run_length:
+                runs.append(self._spill(chunk[: self.run_length], work_dir, len(runs)))
+                chunk = chunk[self.run_length :]
+
+        if chunk:
+            runs.append(self._spill(chunk, work_dir, len(runs)))
+
+        return runs, count
+
+    def _spill(self, chunk: list[int], work_dir: str, index: int) -> str:
+        # Sort one chunk in memory with the existing merge logic and write it out as a binary run
+        self.sorter.sort(chunk, self.strategy)
+        path = os.path.join(work_dir, f"run_{index}.bin")
+        self._write_run(path, chunk)
+        return path
+
+    def _write_run(self, path: str, values: list[int]) -> None:
+        try:
+            data = array(ITEM_CODE, values)
+        except OverflowError:
+            raise ValueError(
+                "External sort only supports integers that fit in 64 bits."
+            )
+        with open(path, "wb") as file:
+            data.tofile(file)
+
+    def _read_run(self, path: str, buffer_items: int) -> Iterator[int]:
+        # Stream a run back from disk, buffer_items integers per read
+        with open(path, "rb") as file:
+            while True:
+                data = file.read(buffer_items * ITEM_SIZE)
+                if not data:
+                    break
+                block = array(ITEM_CODE)
+                block.frombytes(data)
+                yield from block
+
+    def _merge_runs(self, runs: list[str]) -> Iterator[int]:
+        # k-way merge of the run files, every run gets an equal share of the memory budget
+        buffer_items = max(1, self.memory_budget // ((len(runs) + 1) * ITEM_SIZE))
+        readers = [self._read_run(path, buffer_items) for path in runs]
+        return self.sorter.merge_iterables(readers)
+
+    def _merge_pass(self, runs: list[str], work_dir: str, merge_pass: int) -> list[str]:
+        # Merge every group of fan_in runs into a single run file and remove the inputs
+        merged_runs: list[str] = []
+        for start in range(0, len(runs), self.fan_in):
+            group = runs[start : start + self.fan_in]
+            path = os.path.join(
+                work_dir, f"pass_{merge_pass}_run_{len(merged_runs)}.bin"
+            )
+
+            with open(path, "wb") as file:
+                batch = array(ITEM_CODE)
+                for value in self._merge_runs(group):
+                    batch.append(value)
+                    if len(batch) >= WRITE_BATCH:
+                        batch.tofile(file)
+                        batch = array(ITEM_CODE)
+                batch.tofile(file)
+
+            for run in group:
+                os.remove(run)
+            merged_runs.append(path)
+
+        return merged_runs
+
+
+def external_sort() -> None:
+    print("Problem 1: External Merge Sort.")
+    print(
+        "Sorts a file of whitespace separated integers that may be larger than memory."
+    )
+
+    input_path = input("Enter the input file path: ").strip()
+    if not os.path.isfile(input_path):
+        print(f"File '{input_path}' does not exist.")
+        return
+    output_path = input("Enter the output file path: ").strip()
+
+    budget_input = input("Memory budget in MB (press Enter for 64): ").strip()
+    try:
+        memory_budget = (
+            int(budget_input) * 1024 * 1024 if budget_input else 64 * 1024 * 1024
+        )
+        sorter = ExternalMergeSort(memory_budget=memory_budget)
+        count = sorter.sort_file(input_path, output_path)
+    except ValueError as error:
+        print(f"Could not sort the file: {error}")
+        return
+
+    print(f"Sorted {count} integers into '{output_path}'.")
+
+
+if __name__ == "__main__":
+    external_sort()
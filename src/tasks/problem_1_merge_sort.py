@@ -1,9 +1,159 @@
-class MergeSort:
-    # We need to merge two sorted halves of the arr into a single sorted segment
-    def merge(self, arr: list[int], left: int, mid: int, right: int) -> None:
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, typed buffers then use the pure Python merge
+    np = None
+
+# Adaptive (Timsort style) tuning, these are the same values CPython's list.sort uses
+MIN_MERGE = 64  # Inputs shorter than this are just binary insertion sorted
+MIN_GALLOP = 7  # Wins in a row before a merge switches to galloping
+
+# With NumPy, blocks of this many elements are sorted together before the vectorised merge passes
+NUMPY_BLOCK = 1024
+
+T = TypeVar("T")
+KeyFunction = Callable[[Any], Any]
+
+# Marks a stream in the LoserTree that has run out of elements
+_EXHAUSTED = object()
+
+
+class MergeSortTracer:
+    """
+    Receives the divide and merge events of a merge sort.
+    The base class ignores every event, subclass it and override the hooks you need.
+    """
+
+    def on_divide(self, arr: list[int], left: int, mid: int, right: int) -> None:
+        # Called before arr[left...right] is split into arr[left...mid] and arr[mid+1...right]
+        pass
+
+    def on_merge_start(self, arr: list[int], left: int, mid: int, right: int) -> None:
+        # Called before the sorted arr[left...mid] and arr[mid+1...right] are merged
+        pass
+
+    def on_merge_end(self, arr: list[int], left: int, right: int) -> None:
+        # Called once arr[left...right] holds the merged result
+        pass
+
+
+class PrintTracer(MergeSortTracer):
+    # Narrates every step of the sort to stdout, this is what problem_1 shows the user
+    def on_divide(self, arr: list[int], left: int, mid: int, right: int) -> None:
+        print(f"\nDividing: {arr[left:right + 1]} into")
+        print(f"  Left: {arr[left:mid + 1]}")
+        print(f"  Right: {arr[mid + 1:right + 1]}")
+
+    def on_merge_start(self, arr: list[int], left: int, mid: int, right: int) -> None:
         print(
             f"\nMerging left: {arr[left:mid + 1]} and right: {arr[mid + 1:right + 1]}"
         )
+
+    def on_merge_end(self, arr: list[int], left: int, right: int) -> None:
+        print(f"→ Result after merge: {arr[left:right + 1]}")
+
+
+class LoserTree:
+    """
+    A tournament tree of losers for merging k sorted streams.
+    Every internal node keeps the stream that lost the match played there and tree[0] keeps
+    the overall winner, so replacing the winner only replays the matches on its path to the root
+    (one comparison per level). Only the current head of every stream is held in memory.
+    SOURCE: https://en.wikipedia.org/wiki/K-way_merge_algorithm#Tournament_Tree
+    """
+
+    def __init__(
+        self,
+        iterables: Iterable[Iterable[T]],
+        key: KeyFunction | None = None,
+        reverse: bool = False,
+    ) -> None:
+        self.iterators: list[Iterator[T]] = [iter(it) for it in iterables]
+        self.key = key
+        self.reverse = reverse
+        self.size: int = len(self.iterators)
+
+        # The current head of every stream and its key
+        self.values: list[Any] = [_EXHAUSTED] * self.size
+        self.keys: list[Any] = [None] * self.size
+        for index in range(self.size):
+            self._pull(index)
+
+        # Nodes 1 ... size - 1 are the matches and the leaves are size ... 2 * size - 1
+        self.tree: list[int] = [0] * max(self.size, 1)
+        if self.size > 0:
+            self.tree[0] = self._build(1)
+
+    def is_empty(self) -> bool:
+        return self.size == 0 or self.values[self.tree[0]] is _EXHAUSTED
+
+    def peek(self) -> T:
+        # The next element of the merge, without consuming it
+        return self.values[self.tree[0]]
+
+    def advance(self) -> None:
+        # Drop the winner, pull the next element of its stream and replay its path
+        winner = self.tree[0]
+        self._pull(winner)
+
+        node = (winner + self.size) // 2
+        while node > 0:
+            if self._beats(self.tree[node], winner):
+                self.tree[node], winner = winner, self.tree[node]
+            node //= 2
+        self.tree[0] = winner
+
+    def _pull(self, index: int) -> None:
+        value = next(self.iterators[index], _EXHAUSTED)
+        self.values[index] = value
+        if value is _EXHAUSTED:
+            self.keys[index] = None
+        else:
+            self.keys[index] = value if self.key is None else self.key(value)
+
+    def _build(self, node: int) -> int:
+        # Play the matches below node and return the stream that wins them
+        if node >= self.size:
+            return node - self.size
+        left = self._build(2 * node)
+        right = self._build(2 * node + 1)
+        if self._beats(left, right):
+            self.tree[node] = right
+            return left
+        self.tree[node] = left
+        return right
+
+    def _beats(self, a: int, b: int) -> bool:
+        # Whether the head of stream a comes out before the head of stream b.
+        # Exhausted streams always lose and equal keys go to the lower stream index (stability).
+        if self.values[a] is _EXHAUSTED:
+            return False
+        if self.values[b] is _EXHAUSTED:
+            return True
+        key_a = self.keys[a]
+        key_b = self.keys[b]
+        if self.reverse:
+            key_a, key_b = key_b, key_a
+        if key_a < key_b:
+            return True
+        if key_b < key_a:
+            return False
+        return a < b
+
+
+class MergeSort:
+    def __init__(self, tracer: MergeSortTracer | None = None) -> None:
+        # No tracer means no events are built at all, so a silent sort only pays for a None check
+        self.tracer = tracer
+
+    # We need to merge two sorted halves of the arr into a single sorted segment
+    def merge(self, arr: list[int], left: int, mid: int, right: int) -> None:
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.on_merge_start(arr, left, mid, right)
         n1 = mid - left + 1  # n1 is the size of the left subarray
         n2 = right - mid  # n2 is the size of the right subarray
 
@@ -49,16 +199,16 @@ class MergeSort:
             j += 1
             k += 1
 
-        print(f"→ Result after merge: {arr[left:right + 1]}")
+        if tracer is not None:
+            tracer.on_merge_end(arr, left, right)
 
     # Now we need a recursive function to divide the array and
     # call merge() to sort and combine.
     def merge_sort(self, arr: list[int], left: int, right: int) -> None:
         if left < right:  # Check whether there is more than one element
             mid = (left + right) // 2  # Find the mid of the array
-            print(f"\nDividing: {arr[left:right + 1]} into")
-            print(f"  Left: {arr[left:mid + 1]}")
-            print(f"  Right: {arr[mid + 1:right + 1]}")
+            if self.tracer is not None:
+                self.tracer.on_divide(arr, left, mid, right)
 
             self.merge_sort(arr, left, mid)  # Now we recursively sort the left half.
             self.merge_sort(
@@ -66,15 +216,467 @@ class MergeSort:
             )  # Then we recursively sort the right half
             self.merge(arr, left, mid, right)  # Then we merge it into a sorted array
 
+    # An iterative version of merge_sort that merges runs of width 1, 2, 4, ... bottom up.
+    # Only one scratch buffer is allocated per sort, each pass merges from one buffer into
+    # the other and then the two swap roles (ping-pong) so nothing is copied back per merge.
+    def merge_sort_bottom_up(self, arr: list[int]) -> None:
+        n = len(arr)
+        if n < 2:
+            return
+
+        src = arr
+        # The single auxiliary buffer for the whole sort
+        dst = self._scratch_buffer(arr)
+        width = 1
+        while width < n:
+            for left in range(0, n, 2 * width):
+                mid = min(left + width, n)
+                right = min(left + 2 * width, n)
+                self._merge_into(src, dst, left, mid, right)
+            src, dst = dst, src
+            width *= 2
+
+        # After an odd number of passes the sorted data sits in the scratch buffer
+        if src is not arr:
+            arr[:] = src
+
+    def _scratch_buffer(self, arr: list[int]) -> list[int]:
+        # A copy of arr of the same kind, slicing a memoryview would only give another view
+        if isinstance(arr, memoryview):
+            scratch = memoryview(bytearray(arr.nbytes)).cast(arr.format)
+            scratch[:] = arr
+            return scratch
+        return arr[:]
+
+    def _merge_into(
+        self, src: list[int], dst: list[int], left: int, mid: int, right: int
+    ) -> None:
+        # Merge the sorted src[left:mid] and src[mid:right] into dst[left:right]
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.on_merge_start(src, left, mid - 1, right - 1)
+
+        # If there is no right run, or the runs are already in order, it is a straight copy
+        if mid >= right or src[mid - 1] <= src[mid]:
+            dst[left:right] = src[left:right]
+        else:
+            i = left
+            j = mid
+            k = left
+            while i < mid and j < right:
+                if src[i] <= src[j]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+
+            # Only one of the runs can have anything left, copy it over in one go
+            if i < mid:
+                dst[k:right] = src[i:mid]
+            else:
+                dst[k:right] = src[j:right]
+
+        if tracer is not None:
+            tracer.on_merge_end(dst, left, right - 1)
+
+    # An adaptive natural merge sort in the style of Timsort.
+    # Instead of always splitting in the middle, it finds the runs that are already sorted in arr,
+    # so nearly sorted input only needs a few cheap merges and runs close to linear time.
+    # SOURCE: https://github.com/python/cpython/blob/main/Objects/listsort.txt
+    def merge_sort_adaptive(self, arr: list[int]) -> None:
+        n = len(arr)
+        if n < 2:
+            return
+
+        min_run = self._min_run_length(n)
+        runs: list[tuple[int, int]] = []  # Stack of pending runs as (start, length)
+        min_gallop = MIN_GALLOP
+
+        lo = 0
+        while lo < n:
+            run_length = self._count_run(arr, lo, n)
+
+            # Short runs are extended to min_run elements with binary insertion
+            if run_length < min_run:
+                forced = min(min_run, n - lo)
+                self._binary_insertion_sort(arr, lo, lo + forced, lo + run_length)
+                run_length = forced
+
+            runs.append((lo, run_length))
+            min_gallop = self._merge_collapse(arr, runs, min_gallop)
+            lo += run_length
+
+        # Merge whatever is left on the stack, from the top down
+        while len(runs) > 1:
+            min_gallop = self._merge_at(arr, runs, len(runs) - 2, min_gallop)
+
+    def _min_run_length(self, n: int) -> int:
+        # Pick a run length in [MIN_MERGE / 2, MIN_MERGE] so n / min_run is (close to) a power of 2
+        extra = 0
+        while n >= MIN_MERGE:
+            extra |= n & 1
+            n >>= 1
+        return n + extra
+
+    def _count_run(self, arr: list[int], lo: int, hi: int) -> int:
+        # Length of the run starting at lo, a strictly descending run is reversed in place.
+        # Descending has to be strict, otherwise reversing would break stability.
+        run_hi = lo + 1
+        if run_hi == hi:
+            return 1
+
+        if arr[run_hi] < arr[lo]:
+            run_hi += 1
+            while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+                run_hi += 1
+            arr[lo:run_hi] = arr[lo:run_hi][::-1]
+        else:
+            run_hi += 1
+            while run_hi < hi and arr[run_hi] >= arr[run_hi - 1]:
+                run_hi += 1
+
+        return run_hi - lo
+
+    def _binary_insertion_sort(
+        self, arr: list[int], lo: int, hi: int, start: int
+    ) -> None:
+        # arr[lo:start] is already sorted, insert the rest of arr[lo:hi] one by one
+        for i in range(start, hi):
+            pivot = arr[i]
+            # bisect_right keeps equal elements in their original order
+            pos = bisect_right(arr, pivot, lo, i)
+            arr[pos + 1 : i + 1] = arr[pos:i]
+            arr[pos] = pivot
+
+    def _merge_collapse(
+        self, arr: list[int], runs: list[tuple[int, int]], min_gallop: int
+    ) -> int:
+        # Keep the run lengths on the stack growing roughly like Fibonacci numbers
+        # so the merges stay balanced and the stack stays O(log n) deep
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+                n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+            ):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            min_gallop = self._merge_at(arr, runs, n, min_gallop)
+        return min_gallop
+
+    def _merge_at(
+        self, arr: list[int], runs: list[tuple[int, int]], index: int, min_gallop: int
+    ) -> int:
+        # Merge the runs at index and index + 1 of the stack into one
+        base, length_a = runs[index]
+        _, length_b = runs[index + 1]
+        runs[index] = (base, length_a + length_b)
+        del runs[index + 1]
+        return self._merge_galloping(
+            arr, base, base + length_a, base + length_a + length_b, min_gallop
+        )
+
+    def _gallop_right(self, key: int, a: list[int], lo: int, hi: int) -> int:
+        # First index in a[lo:hi] whose value is greater than key.
+        # Searches 1, 3, 7, 15, ... away from lo first so a short answer is found quickly
+        if lo == hi or key < a[lo]:
+            return lo
+        last = lo
+        offset = 1
+        while lo + offset < hi and a[lo + offset] <= key:
+            last = lo + offset
+            offset = offset * 2 + 1
+        return bisect_right(a, key, last + 1, min(lo + offset, hi))
+
+    def _gallop_left(self, key: int, a: list[int], lo: int, hi: int) -> int:
+        # First index in a[lo:hi] whose value is greater than or equal to key
+        if lo == hi or key <= a[lo]:
+            return lo
+        last = lo
+        offset = 1
+        while lo + offset < hi and a[lo + offset] < key:
+            last = lo + offset
+            offset = offset * 2 + 1
+        return bisect_left(a, key, last + 1, min(lo + offset, hi))
+
+    def _merge_galloping(
+        self, arr: list[int], lo: int, mid: int, hi: int, min_gallop: int
+    ) -> int:
+        # Merge the sorted arr[lo:mid] and arr[mid:hi] in place and return the updated min_gallop
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.on_merge_start(arr, lo, mid - 1, hi - 1)
+        start, end = lo, hi
+
+        # Elements of the left run that are <= the first right element are already in place,
+        # and so are elements of the right run that are >= the last left element
+        lo = self._gallop_right(arr[mid], arr, lo, mid)
+        if lo < mid:
+            hi = self._gallop_left(arr[mid - 1], arr, mid, hi)
+            min_gallop = self._merge_lo(arr, lo, mid, hi, min_gallop)
+
+        if tracer is not None:
+            tracer.on_merge_end(arr, start, end - 1)
+        return min_gallop
+
+    def _merge_lo(
+        self, arr: list[int], lo: int, mid: int, hi: int, min_gallop: int
+    ) -> int:
+        # Copy the left run out and merge forwards into arr[lo:hi].
+        # The write index never passes the read index of the right run, so that stays in place.
+        left = arr[lo:mid]
+        n1 = len(left)
+        i = 0
+        j = mid
+        k = lo
+
+        while True:
+            # One pair at a time, until one side wins min_gallop times in a row
+            left_wins = 0
+            right_wins = 0
+            while True:
+                if arr[j] < left[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    arr[k] = left[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+                k += 1
+                if i == n1 or j == hi:
+                    break
+                if left_wins >= min_gallop or right_wins >= min_gallop:
+                    break
+            if i == n1 or j == hi:
+                break
+
+            # Galloping, search for where the next element of the other run goes and
+            # move the whole block in front of it with one slice assignment
+            while True:
+                idx = self._gallop_right(arr[j], left, i, n1)
+                left_count = idx - i
+                if left_count:
+                    arr[k : k + left_count] = left[i:idx]
+                    k += left_count
+                    i = idx
+                    if i == n1:
+                        break
+                arr[k] = arr[j]
+                k += 1
+                j += 1
+                if j == hi:
+                    break
+
+                idx = self._gallop_left(left[i], arr, j, hi)
+                right_count = idx - j
+                if right_count:
+                    arr[k : k + right_count] = arr[j:idx]
+                    k += right_count
+                    j = idx
+                    if j == hi:
+                        break
+                arr[k] = left[i]
+                k += 1
+                i += 1
+                if i == n1:
+                    break
+
+                # Galloping keeps paying off so make it easier to get back into
+                min_gallop = max(min_gallop - 1, 1)
+                if left_count < MIN_GALLOP and right_count < MIN_GALLOP:
+                    break
+            if i == n1 or j == hi:
+                break
+            # Leaving galloping mode is penalised so random data does not keep flipping modes
+            min_gallop += 2
+
+        # Whatever is left of the right run is already in place, only the left run needs copying
+        if i < n1:
+            arr[k : k + n1 - i] = left[i:]
+        return min_gallop
+
+    # Sort arr in place, strategy picks the implementation: "recursive" (merge_sort),
+    # "bottom_up" (merge_sort_bottom_up) or "adaptive" (merge_sort_adaptive).
+    # Like list.sort, key can be a function (or a sequence of functions for several sort keys,
+    # most significant first) and reverse a bool (or one bool per key).
+    def sort(
+        self,
+        arr: list[T],
+        strategy: str = "recursive",
+        key: KeyFunction | Sequence[KeyFunction] | None = None,
+        reverse: bool | Sequence[bool] = False,
+    ) -> None:
+        if key is None:
+            if not isinstance(reverse, bool):
+                raise ValueError(
+                    "Use a single reverse flag when sorting without a key."
+                )
+            self._sort_by_key(arr, strategy, None, reverse)
+            return
+
+        keys = [key] if callable(key) else list(key)
+        if not keys:
+            raise ValueError("key list must not be empty")
+        reverses = [reverse] * len(keys) if isinstance(reverse, bool) else list(reverse)
+        if len(keys) != len(reverses):
+            raise ValueError("Give exactly one reverse flag per sort key.")
+
+        if all(flag == reverses[0] for flag in reverses):
+            # Every key goes the same way, so one pass on the combined key is enough
+            if len(keys) == 1:
+                self._sort_by_key(arr, strategy, keys[0], reverses[0])
+            else:
+
+                def combined(item: Any) -> tuple:
+                    return tuple(k(item) for k in keys)
+
+                self._sort_by_key(arr, strategy, combined, reverses[0])
+        else:
+            # Mixed directions: one stable pass per key, least significant key first,
+            # each pass keeps the order of the previous ones for equal keys
+            for k, flag in zip(reversed(keys), reversed(reverses)):
+                self._sort_by_key(arr, strategy, k, flag)
+
+    def _sort_by_key(
+        self, arr: list[T], strategy: str, key: KeyFunction | None, reverse: bool
+    ) -> None:
+        # Reversing before and after an ascending stable sort gives a descending sort
+        # that still keeps equal elements in their original order
+        if reverse:
+            arr.reverse()
+
+        if key is None:
+            self._sort_with_strategy(arr, strategy)
+        else:
+            # Decorate-sort-undecorate: key is called once per element, and the index breaks ties
+            # so the records themselves are never compared and the sort stays stable
+            decorated = [(key(item), index) for index, item in enumerate(arr)]
+            self._sort_with_strategy(decorated, strategy)
+            arr[:] = [arr[index] for _, index in decorated]
+
+        if reverse:
+            arr.reverse()
+
+    def _sort_with_strategy(self, arr: list[Any], strategy: str) -> None:
+        if strategy == "recursive":
+            self.merge_sort(arr, 0, len(arr) - 1)
+        elif strategy == "bottom_up":
+            self.merge_sort_bottom_up(arr)
+        elif strategy == "adaptive":
+            self.merge_sort_adaptive(arr)
+        else:
+            raise ValueError(f"Unknown merge sort strategy: {strategy}")
+
+    # Sort a typed buffer in place: an array.array, a writable one dimensional memoryview
+    # or a NumPy array. The values stay unboxed in their buffer (8 bytes for a "q" array instead
+    # of a pointer plus an int object per element) and are never converted to a list and back.
+    def sort_buffer(self, buf: "array | memoryview | np.ndarray") -> None:
+        if isinstance(buf, memoryview) and (buf.ndim != 1 or buf.readonly):
+            raise ValueError("Only writable one dimensional memoryviews can be sorted.")
+
+        if np is None:
+            self.merge_sort_bottom_up(buf)
+            return
+
+        # A NumPy view shares the memory of the buffer, so sorting it sorts the buffer
+        if not isinstance(buf, np.ndarray):
+            buf = np.asarray(memoryview(buf))
+        self._merge_sort_numpy(buf)
+
+    def _merge_sort_numpy(self, arr: "np.ndarray") -> None:
+        # Bottom-up merge sort where every merge is a handful of vectorised NumPy calls
+        if arr.ndim != 1:
+            raise ValueError("Only one dimensional arrays can be sorted.")
+        n = arr.shape[0]
+        if n < 2:
+            return
+
+        # Sort all the NUMPY_BLOCK sized blocks at once, then the leftover tail
+        full = n // NUMPY_BLOCK * NUMPY_BLOCK
+        if full:
+            blocks = arr[:full].reshape(-1, NUMPY_BLOCK)
+            arr[:full] = np.sort(blocks, axis=1, kind="stable").reshape(-1)
+        arr[full:] = np.sort(arr[full:], kind="stable")
+
+        src = arr
+        dst = np.empty_like(arr)
+        width = NUMPY_BLOCK
+        while width < n:
+            for left in range(0, n, 2 * width):
+                mid = min(left + width, n)
+                right = min(left + 2 * width, n)
+                self._merge_into_numpy(src, dst, left, mid, right)
+            src, dst = dst, src
+            width *= 2
+
+        if src is not arr:
+            arr[:] = src
+
+    def _merge_into_numpy(
+        self, src: "np.ndarray", dst: "np.ndarray", left: int, mid: int, right: int
+    ) -> None:
+        # Merge the sorted src[left:mid] and src[mid:right] into dst[left:right]
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.on_merge_start(src, left, mid - 1, right - 1)
+
+        a = src[left:mid]
+        b = src[mid:right]
+        if b.size == 0 or a[-1] <= b[0]:
+            dst[left:right] = src[left:right]
+        else:
+            # An element ends up at its index in its own run plus the number of elements of the
+            # other run that go before it. Ties go to the left run, which keeps the merge stable.
+            out = dst[left:right]
+            out[np.arange(a.size) + np.searchsorted(b, a, side="left")] = a
+            out[np.arange(b.size) + np.searchsorted(a, b, side="right")] = b
+
+        if tracer is not None:
+            tracer.on_merge_end(dst, left, right - 1)
+
     # this method is to create a copy instead of mutating the original
-    def sort_copy(self, arr: list[int]) -> list[int]:
+    def sort_copy(
+        self,
+        arr: list[T],
+        strategy: str = "recursive",
+        key: KeyFunction | Sequence[KeyFunction] | None = None,
+        reverse: bool | Sequence[bool] = False,
+    ) -> list[T]:
         arr_copy = arr[:]  # Manually copy from the original
-        self.merge_sort(arr_copy, 0, len(arr_copy) - 1)
+        self.sort(arr_copy, strategy, key, reverse)
         return arr_copy
 
+    # Lazily merge any number of already sorted iterables (sorted by the same key and reverse).
+    # Elements are yielded one at a time and a stream is only read when its next element is needed,
+    # so only O(k) elements are held at once. limit stops the merge after that many elements.
+    def merge_iterables(
+        self,
+        iterables: Iterable[Iterable[T]],
+        key: KeyFunction | None = None,
+        reverse: bool = False,
+        limit: int | None = None,
+    ) -> Iterator[T]:
+        if limit is not None and limit <= 0:
+            return
+
+        tree = LoserTree(iterables, key, reverse)
+        produced = 0
+        while not tree.is_empty():
+            yield tree.peek()
+            produced += 1
+            if produced == limit:
+                return
+            tree.advance()
+
 
 def problem_1() -> None:
-    sorter = MergeSort()
+    sorter = MergeSort(tracer=PrintTracer())
     print("Problem 1: Merge Sort.")
     while True:
         # Now we ask for the user input then put it into the mergeSort function
@@ -0,0 +1,196 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from tasks.problem_1_external_sort import ITEM_CODE, ITEM_SIZE
+from tasks.problem_1_merge_sort import MergeSort
+
+# Below this many elements starting processes costs more than it saves
+PARALLEL_CUTOFF = 100_000
+
+
+def _sort_segment(name: str, lo: int, hi: int, strategy: str) -> None:
+    # Worker: sort buffer[lo:hi] in place
+    # The parent owns the buffer, workers only attach to it and close it again
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(ITEM_CODE)
+    try:
+        segment = view[lo:hi].tolist()
+        MergeSort().sort(segment, strategy)
+        view[lo:hi] = array(ITEM_CODE, segment)
+    finally:
+        view.release()
+        shm.close()
+
+
+def _merge_segment(
+    src_name: str, dst_name: str, a_lo: int, a_hi: int, b_lo: int, b_hi: int, out: int
+) -> None:
+    # Worker: merge the sorted src[a_lo:a_hi] and src[b_lo:b_hi] into dst starting at out
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    src_view = src.buf.cast(ITEM_CODE)
+    dst_view = dst.buf.cast(ITEM_CODE)
+    try:
+        left = src_view[a_lo:a_hi].tolist()
+        combined = left + src_view[b_lo:b_hi].tolist()
+        merged = combined[:]
+        MergeSort()._merge_into(combined, merged, 0, len(left), len(combined))
+        dst_view[out : out + len(merged)] = array(ITEM_CODE, merged)
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+class ParallelMergeSort:
+    """
+    Merge sort spread over a process pool.
+    The array is copied once into shared memory and split into one segment per worker,
+    the workers sort their segments in place, and the sorted segments are then merged pairwise
+    level by level between two shared buffers. Every pairwise merge is itself split into
+    independent pieces with co-ranking, so the last levels still keep all workers busy.
+    SOURCE: https://arxiv.org/abs/1202.6575 (Merge Path)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        cutoff: int = PARALLEL_CUTOFF,
+        strategy: str = "bottom_up",
+    ) -> None:
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.cutoff = cutoff
+        self.strategy = strategy
+        self.sorter = MergeSort()
+
+    def sort(self, arr: list[int]) -> None:
+        n = len(arr)
+        # Below the cutoff (or with one worker), copying into shared memory and merging the runs
+        # again costs more than sorting the list here
+        if n < self.cutoff or self.workers < 2:
+            self.sorter.sort(arr, self.strategy)
+            return
+
+        try:
+            data = array(ITEM_CODE, arr)
+        except OverflowError:
+            # Values outside 64 bits cannot live in the shared buffers
+            self.sorter.sort(arr, self.strategy)
+            return
+
+        src = shared_memory.SharedMemory(create=True, size=n * ITEM_SIZE)
+        dst = shared_memory.SharedMemory(create=True, size=n * ITEM_SIZE)
+        try:
+            view = src.buf.cast(ITEM_CODE)
+            view[:] = data
+            view.release()
+            del data
+
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # Sort one segment per worker
+                bounds = [n * i // self.workers for i in range(self.workers + 1)]
+                segments = [
+                    (bounds[i], bounds[i + 1])
+                    for i in range(self.workers)
+                    if bounds[i] < bounds[i + 1]
+                ]
+                futures = [
+                    pool.submit(_sort_segment, src.name, lo, hi, self.strategy)
+                    for lo, hi in segments
+                ]
+                for future in futures:
+                    future.result()
+
+                # Merge neighbouring segments until one is left, swapping buffers each level
+                while len(segments) > 1:
+                    segments = self._merge_level(pool, src, dst, segments, n)
+                    src, dst = dst, src
+
+            view = src.buf.cast(ITEM_CODE)
+            arr[:] = view.tolist()
+            view.release()
+        finally:
+            for shm in (src, dst):
+                shm.close()
+                shm.unlink()
+
+    def sort_copy(self, arr: list[int]) -> list[int]:
+        arr_copy = arr[:]
+        self.sort(arr_copy)
+        return arr_copy
+
+    def _merge_level(
+        self,
+        pool: ProcessPoolExecutor,
+        src: shared_memory.SharedMemory,
+        dst: shared_memory.SharedMemory,
+        segments: list[tuple[int, int]],
+        n: int,
+    ) -> list[tuple[int, int]]:
+        # Merge segments pairwise from src into dst, split into pieces of about n / workers outputs
+        futures = []
+        merged_segments: list[tuple[int, int]] = []
+
+        src_view = src.buf.cast(ITEM_CODE)
+        try:
+            for i in range(0, len(segments), 2):
+                a_lo, a_hi = segments[i]
+                if i + 1 == len(segments):
+                    # An odd segment out has no partner and is just carried over
+                    b_lo = b_hi = a_hi
+                else:
+                    b_lo, b_hi = segments[i + 1]
+
+                total = b_hi - a_lo
+                pieces = max(1, self.workers * total // n)
+                previous = (a_lo, b_lo)
+                for p in range(1, pieces + 1):
+                    if p == pieces:
+                        split = (a_hi, b_hi)
+                    else:
+                        split = self._co_rank(
+                            src_view, a_lo, a_hi, b_lo, b_hi, total * p // pieces
+                        )
+                    futures.append(
+                        pool.submit(
+                            _merge_segment,
+                            src.name,
+                            dst.name,
+                            previous[0],
+                            split[0],
+                            previous[1],
+                            split[1],
+                            previous[0] + (previous[1] - b_lo),
+                        )
+                    )
+                    previous = split
+
+                merged_segments.append((a_lo, b_hi))
+        finally:
+            src_view.release()
+
+        for future in futures:
+            future.result()
+        return merged_segments
+
+    def _co_rank(
+        self, view: memoryview, a_lo: int, a_hi: int, b_lo: int, b_hi: int, k: int
+    ) -> tuple[int, int]:
+        # Find (i, j) with (i - a_lo) + (j - b_lo) == k such that the first k outputs of the
+        # stable merge are exactly A[a_lo:i] and B[b_lo:j], i.e. A[i - 1] <= B[j] and B[j - 1] < A[i].
+        # Binary search over how many of the k outputs come from A.
+        low = max(0, k - (b_hi - b_lo))
+        high = min(k, a_hi - a_lo)
+        while low < high:
+            take_a = (low + high) // 2
+            i = a_lo + take_a
+            j = b_lo + k - take_a
+            if j > b_lo and view[j - 1] >= view[i]:
+                # B[j - 1] would be output after A[i], so more elements must come from A
+                low = take_a + 1
+            else:
+                high = take_a
+        return a_lo + low, b_lo + k - low
@@ -0,0 +1,218 @@
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Iterator
+
+from tasks.problem_2_dijkstras_algorithm import CSRGraph, DijkstraAlgorithm
+
+# Distances are stored as 64-bit floats so unreachable vertices can be inf
+DISTANCE_CODE = "d"
+DISTANCE_SIZE = array(DISTANCE_CODE).itemsize
+
+# Sources per task. A full search takes far longer than sending a few ids, so tasks can stay
+# small and the rows come back, and can be used, soon after they are solved.
+ROWS_PER_TASK = 8
+
+# The graph of a worker process, attached to the parent's shared memory once per worker
+_graph: CSRGraph | None = None
+_solver: DijkstraAlgorithm | None = None
+_blocks: list[shared_memory.SharedMemory] = []
+
+
+def attach_graph(
+    names: list[str], blocks: list[tuple[str, str, int]], queue: str
+) -> None:
+    # Worker initializer: wrap the shared offsets, targets and weights without copying them.
+    # The blocks stay open for the life of the worker, the parent unlinks them when the pool is done.
+    global _graph, _solver
+    views = []
+    for name, code, length in blocks:
+        shm = shared_memory.SharedMemory(name=name)
+        _blocks.append(shm)
+        itemsize = array(code).itemsize
+        views.append(shm.buf[: length * itemsize].cast(code).toreadonly())
+    _graph = CSRGraph(names, views[0], views[1], views[2])
+    _solver = DijkstraAlgorithm(queue)
+
+
+def share_graph(
+    graph: CSRGraph,
+) -> tuple[list[shared_memory.SharedMemory], list[tuple[str, str, int]]]:
+    # Copy the offsets, targets and weights into shared memory blocks, once per pool.
+    # Returns the blocks (the caller closes and unlinks them) and the specs for attach_graph.
+    blocks: list[shared_memory.SharedMemory] = []
+    specs: list[tuple[str, str, int]] = []
+    try:
+        for data in (graph.offsets, graph.targets, graph.weights):
+            # The arrays may be memoryviews of a mapped snapshot, so go through memoryview
+            raw = memoryview(data)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, raw.nbytes))
+            blocks.append(shm)
+            shm.buf[: raw.nbytes] = raw.cast("B")
+            specs.append((shm.name, raw.format, len(raw)))
+    except BaseException:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+        raise
+    return blocks, specs
+
+
+def solve_tree(source: int) -> tuple[bytes, bytes]:
+    # Worker: one full search, the distances (float64) and predecessors (int64) as raw bytes
+    distance, previous = _solver._dijkstra(_graph, source)
+    return array(DISTANCE_CODE, distance).tobytes(), previous.tobytes()
+
+
+def solve_path(source: int, target: int) -> tuple[float, list[str] | None]:
+    # Worker: a search that stops once target is settled, only its distance and path go back
+    distance, previous = _solver._dijkstra(_graph, source, target=target)
+    if distance[target] == float("inf"):
+        return distance[target], None
+    return distance[target], _solver._reconstruct_path(_graph, previous, target)
+
+
+def _solve_rows(sources: list[int]) -> tuple[list[int], bytes]:
+    # Worker: one full search per source, the rows are sent back as raw float64 bytes
+    rows = array(DISTANCE_CODE)
+    for source in sources:
+        distance, _ = _solver._dijkstra(_graph, source)
+        rows.extend(distance)
+    return sources, rows.tobytes()
+
+
+class DistanceMatrix:
+    """
+    A row-major float64 distance table: row i holds the distances from sources[i] to every vertex
+    (inf when unreachable), 8 bytes per entry. It lives in a bytearray, or in a file that is
+    memory-mapped so tables bigger than memory are paged in only where they are read.
+    """
+
+    def __init__(
+        self, sources: list[str], names: list[str], path: str | None = None
+    ) -> None:
+        self.sources = sources
+        self.names = names
+        self.row_index: dict[str, int] = {name: i for i, name in enumerate(sources)}
+        if len(self.row_index) != len(sources):
+            raise ValueError("Sources must not repeat, every source has one row.")
+        self.index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        size = len(sources) * len(names) * DISTANCE_SIZE
+
+        self.path = path
+        self._file = None
+        if path is None:
+            self._buffer: bytearray | mmap.mmap = bytearray(size)
+        else:
+            self._file = open(path, "w+b")
+            self._file.truncate(size)
+            # mmap cannot map an empty file
+            self._buffer = mmap.mmap(self._file.fileno(), size) if size else bytearray()
+        self._view = memoryview(self._buffer).cast(DISTANCE_CODE)
+
+    def row(self, source: str) -> memoryview:
+        # A view of the distances from source, indexed by vertex id like graph.names
+        start = self.row_index[source] * len(self.names)
+        return self._view[start : start + len(self.names)]
+
+    def distance(self, source: str, target: str) -> float:
+        return self._view[self.row_index[source] * len(self.names) + self.index[target]]
+
+    def _write_rows(self, first_row: int, data: bytes) -> None:
+        start = first_row * len(self.names) * DISTANCE_SIZE
+        memoryview(self._buffer)[start : start + len(data)] = data
+
+    def close(self) -> None:
+        self._view.release()
+        if self._file is not None:
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
+            self._file.close()
+            self._file = None
+
+
+class BatchShortestPaths:
+    """
+    Distance tables from many sources at once, spread over a process pool.
+    The CSR arrays of the graph are copied once into shared memory, and every worker maps them
+    when it starts, so tasks only carry a few source ids instead of a pickled graph.
+    Rows come back as soon as their task finishes and are written straight into a DistanceMatrix.
+    SOURCE: https://docs.python.org/3/library/multiprocessing.shared_memory.html
+    """
+
+    def __init__(
+        self,
+        graph: dict[str, list[tuple[str, int]]] | CSRGraph,
+        workers: int | None = None,
+        queue: str = "auto",
+    ) -> None:
+        self.solver = DijkstraAlgorithm(queue)
+        self.graph = self.solver._as_csr(graph)
+        if self.graph.vertex_count > 0 and min(self.graph.weights, default=0) < 0:
+            raise ValueError("Graph has negative edge weights.")
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        # Pick the queue here, the workers only see array views and should all agree
+        self.queue = self.solver._choose_queue(self.graph) if queue == "auto" else queue
+
+    def distance_matrix(
+        self, sources: list[str] | str = "all", path: str | None = None
+    ) -> DistanceMatrix:
+        # The full table for the sources ("all" for every vertex), memory-mapped at path if given
+        matrix = self.allocate(sources, path)
+        for _ in self.fill(matrix):
+            pass
+        return matrix
+
+    def allocate(
+        self, sources: list[str] | str = "all", path: str | None = None
+    ) -> DistanceMatrix:
+        # An empty matrix for the sources, to be filled row by row with fill()
+        if sources == "all":
+            sources = list(self.graph.names)
+        for source in sources:
+            if source not in self.graph:
+                raise ValueError(
+                    f"Source vertex '{source}' does not exist in the graph."
+                )
+        # A repeated source gets one row, the first time it appears
+        return DistanceMatrix(list(dict.fromkeys(sources)), self.graph.names, path)
+
+    def fill(self, matrix: DistanceMatrix) -> Iterator[tuple[str, memoryview]]:
+        # Compute the rows of matrix and yield (source, row) in the order they complete,
+        # so a caller can start using the first rows while the rest are still being solved
+        ids = [self.graph.index[source] for source in matrix.sources]
+        if not ids:
+            return
+
+        # Up to one task's worth of rows would run on a single worker anyway, and that only
+        # adds copying the graph into shared memory and starting the pool
+        if self.workers < 2 or len(ids) <= ROWS_PER_TASK:
+            for row, source in enumerate(ids):
+                distance, _ = self.solver._dijkstra(self.graph, source)
+                matrix._write_rows(row, array(DISTANCE_CODE, distance).tobytes())
+                yield matrix.sources[row], matrix.row(matrix.sources[row])
+            return
+
+        blocks, specs = share_graph(self.graph)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=attach_graph,
+                initargs=(self.graph.names, specs, self.queue),
+            ) as pool:
+                futures = {
+                    pool.submit(_solve_rows, ids[start : start + ROWS_PER_TASK]): start
+                    for start in range(0, len(ids), ROWS_PER_TASK)
+                }
+                for future in as_completed(futures):
+                    start = futures[future]
+                    done, data = future.result()
+                    matrix._write_rows(start, data)
+                    for row in range(start, start + len(done)):
+                        yield matrix.sources[row], matrix.row(matrix.sources[row])
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
@@ -0,0 +1,412 @@
+import heapq
+import struct
+from array import array
+
+from tasks.problem_2_dijkstras_algorithm import CSRGraph, MinHeap
+
+# A witness search gives up after settling this many vertices. Giving up early only means
+# a shortcut is added that was not strictly needed, the query results stay exact.
+WITNESS_SETTLE_LIMIT = 500
+# The initial ordering only needs an estimate of every vertex's edge difference, so it uses
+# much shorter witness searches (the real contraction recomputes it with the full limit)
+ESTIMATE_SETTLE_LIMIT = 30
+# How much more the edge difference counts than the contracted neighbours in a vertex's priority
+EDGE_DIFFERENCE_WEIGHT = 2
+
+
+class ContractionHierarchy:
+    """
+    Contraction Hierarchies (CH) for answering many shortest path queries on a graph that rarely changes.
+    Preprocessing contracts the vertices one by one, cheapest first by edge difference, with
+    lazy updates: a vertex's priority is recomputed when it comes off the queue and it goes back
+    if it is no longer the cheapest. Witness searches settle at most settle_limit vertices. Removing
+    vertex v adds a shortcut u -> w (weight u -> v -> w) whenever u -> v -> w is the only shortest
+    way from u to w, so distances between the remaining vertices stay the same. The order is the
+    vertex's rank. A query then only follows edges towards higher ranks, forwards from the source
+    and backwards from the target, and meets at the highest ranked vertex of the shortest path.
+    Every shortcut remembers the vertex it skips so the path can be unpacked into original edges.
+    SOURCE: https://en.wikipedia.org/wiki/Contraction_hierarchies
+    SOURCE: https://turing.iem.thm.de/routeplanning/hwy/contract.pdf
+    """
+
+    MAGIC = b"CH02"
+
+    def __init__(
+        self,
+        graph: CSRGraph,
+        rank: array,
+        up: CSRGraph,
+        up_middle: array,
+        down: CSRGraph,
+        down_middle: array,
+    ) -> None:
+        self.graph = graph
+        self.rank = rank  # Contraction order of every vertex
+        # up holds the edges u -> w with rank[u] < rank[w], down holds the edges u -> w with
+        # rank[u] > rank[w] stored reversed (as w -> u) so the backward search also goes upwards.
+        # The middle arrays give the vertex each edge skips, -1 for an original edge.
+        self.up = up
+        self.up_middle = up_middle
+        self.down = down
+        self.down_middle = down_middle
+        # Number of vertices the last query settled
+        self.last_settled: int = 0
+
+    @classmethod
+    def build(
+        cls, graph: CSRGraph, settle_limit: int = WITNESS_SETTLE_LIMIT
+    ) -> "ContractionHierarchy":
+        n = graph.vertex_count
+
+        # The remaining (not yet contracted) graph as adjacency maps, keeping only the lightest
+        # of any parallel edges. out_edges[u][w] is (weight, middle), in_edges[w][u] is the weight.
+        out_edges: list[dict[int, tuple[float, int]]] = [{} for _ in range(n)]
+        in_edges: list[dict[int, float]] = [{} for _ in range(n)]
+        for u in range(n):
+            for e in range(graph.offsets[u], graph.offsets[u + 1]):
+                w = graph.targets[e]
+                weight = graph.weights[e]
+                if w != u and (w not in out_edges[u] or weight < out_edges[u][w][0]):
+                    out_edges[u][w] = (weight, -1)
+                    in_edges[w][u] = weight
+
+        rank = array("q", [0]) * n
+        deleted_neighbours = [0] * n
+        up_edges: list[list[tuple[int, float, int]]] = [[] for _ in range(n)]
+        down_edges: list[list[tuple[int, float, int]]] = [[] for _ in range(n)]
+
+        queue = MinHeap()
+        for v in range(n):
+            shortcuts = cls._find_shortcuts(
+                out_edges, in_edges, v, min(settle_limit, ESTIMATE_SETTLE_LIMIT)
+            )
+            priority = cls._priority(
+                out_edges, in_edges, deleted_neighbours, v, shortcuts
+            )
+            queue.insert((priority, v))
+
+        order = 0
+        while not queue.is_empty():
+            _, v = queue.extract_min()
+
+            # Priorities go stale as neighbours are contracted, so recompute it lazily and
+            # put the vertex back if it is no longer the cheapest one
+            shortcuts = cls._find_shortcuts(out_edges, in_edges, v, settle_limit)
+            priority = cls._priority(
+                out_edges, in_edges, deleted_neighbours, v, shortcuts
+            )
+            if not queue.is_empty() and priority > queue.heap[0][0]:
+                queue.insert((priority, v))
+                continue
+
+            # Everything v is still connected to gets contracted later, i.e. has a higher rank
+            for w, (weight, middle) in out_edges[v].items():
+                up_edges[v].append((w, weight, middle))
+                del in_edges[w][v]
+                deleted_neighbours[w] += 1
+            for u, weight in in_edges[v].items():
+                down_edges[v].append((u, weight, out_edges[u][v][1]))
+                del out_edges[u][v]
+                deleted_neighbours[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+            for u, w, weight in shortcuts:
+                if w not in out_edges[u] or weight < out_edges[u][w][0]:
+                    out_edges[u][w] = (weight, v)
+                    in_edges[w][u] = weight
+
+            rank[v] = order
+            order += 1
+
+        # The weights may be a memoryview (a mapped snapshot or a FrozenGraph), which has no typecode
+        typecode = "q" if graph.integer_weights else "d"
+        up, up_middle = cls._to_csr(graph, up_edges, typecode)
+        down, down_middle = cls._to_csr(graph, down_edges, typecode)
+        return cls(graph, rank, up, up_middle, down, down_middle)
+
+    @staticmethod
+    def _find_shortcuts(
+        out_edges: list[dict[int, tuple[float, int]]],
+        in_edges: list[dict[int, float]],
+        v: int,
+        settle_limit: int,
+    ) -> list[tuple[int, int, float]]:
+        # The shortcuts (u, w, weight) contracting v would need: for every u -> v -> w, look for a
+        # witness path u -> ... -> w that avoids v and is no longer. Without one, add a shortcut.
+        shortcuts: list[tuple[int, int, float]] = []
+        if not out_edges[v]:
+            return shortcuts
+
+        for u, weight_in in in_edges[v].items():
+            candidates = [
+                (w, weight_in + weight_out)
+                for w, (weight_out, _) in out_edges[v].items()
+                if w != u
+            ]
+            if not candidates:
+                continue
+            limit = max(weight for _, weight in candidates)
+            targets = {w for w, _ in candidates}
+
+            # Dijkstra from u in the remaining graph without v, up to the longest candidate.
+            # This runs for every in-edge of every contracted vertex, so it uses heapq (written in C)
+            # rather than MinHeap, and stops as soon as every candidate target is settled.
+            distance: dict[int, float] = {u: 0}
+            done: set[int] = set()
+            remaining = len(candidates)
+            witness_queue: list[tuple[float, int]] = [(0, u)]
+            while witness_queue and len(done) < settle_limit and remaining > 0:
+                current_dist, current = heapq.heappop(witness_queue)
+                if current in done:
+                    continue
+                if current_dist > limit:
+                    break
+                done.add(current)
+                if current in targets:
+                    remaining -= 1
+                for w, (weight, _) in out_edges[current].items():
+                    if w == v:
+                        continue
+                    new_distance = current_dist + weight
+                    # Anything past the longest candidate cannot be a witness, so skip the push
+                    if new_distance <= limit and new_distance < distance.get(
+                        w, float("inf")
+                    ):
+                        distance[w] = new_distance
+                        heapq.heappush(witness_queue, (new_distance, w))
+
+            for w, weight in candidates:
+                if distance.get(w, float("inf")) > weight:
+                    shortcuts.append((u, w, weight))
+
+        return shortcuts
+
+    @staticmethod
+    def _priority(
+        out_edges: list[dict[int, tuple[float, int]]],
+        in_edges: list[dict[int, float]],
+        deleted_neighbours: list[int],
+        v: int,
+        shortcuts: list[tuple[int, int, float]],
+    ) -> int:
+        # Edge difference (shortcuts added minus edges removed), plus the number of contracted
+        # neighbours so the contraction spreads evenly over the graph. The edge difference counts
+        # twice: it is what keeps the fill-in down, the neighbour term only breaks the near ties.
+        edge_difference = len(shortcuts) - len(out_edges[v]) - len(in_edges[v])
+        return EDGE_DIFFERENCE_WEIGHT * edge_difference + deleted_neighbours[v]
+
+    @staticmethod
+    def _to_csr(
+        graph: CSRGraph, edges: list[list[tuple[int, float, int]]], typecode: str
+    ) -> tuple[CSRGraph, array]:
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array(typecode)
+        middles = array("q")
+        for vertex_edges in edges:
+            for target, weight, middle in vertex_edges:
+                targets.append(target)
+                weights.append(weight)
+                middles.append(middle)
+            offsets.append(len(targets))
+        return CSRGraph(graph.names, offsets, targets, weights, graph.index), middles
+
+    def query(self, source: int, target: int) -> tuple[float, list[int]]:
+        # Upward search from both ends. A side stops once its smallest queued distance is
+        # at least the best meeting distance found so far.
+        # Stall-on-demand: a vertex reached more cheaply through a higher ranked neighbour
+        # (an edge the upward search cannot follow) is not on a shortest path, so its edges
+        # are not relaxed. That is what keeps the searches out of most of the dense top levels.
+        if source == target:
+            self.last_settled = 1
+            return 0, [source]
+
+        sides = (self.up, self.down)
+        distance: tuple[dict[int, float], dict[int, float]] = ({source: 0}, {target: 0})
+        # The vertex each vertex was reached from and the index of that edge
+        previous: tuple[dict[int, tuple[int, int]], dict[int, tuple[int, int]]] = (
+            {source: (-1, -1)},
+            {target: (-1, -1)},
+        )
+        done: tuple[set[int], set[int]] = (set(), set())
+        # Settled by every query, so heapq (written in C) rather than MinHeap
+        queues: tuple[list[tuple[float, int]], list[tuple[float, int]]] = (
+            [(0, source)],
+            [(0, target)],
+        )
+
+        best = float("inf")
+        meeting = -1
+        settled = 0
+        side = 1
+        while True:
+            active = [bool(queues[i]) and queues[i][0][0] < best for i in (0, 1)]
+            if not active[0] and not active[1]:
+                break
+            # Alternate between the two searches while both are still running
+            side = 1 - side if active[1 - side] else side
+
+            current_dist, current = heapq.heappop(queues[side])
+            if current in done[side]:
+                continue
+            done[side].add(current)
+            settled += 1
+
+            if current in distance[1 - side]:
+                total = current_dist + distance[1 - side][current]
+                if total < best:
+                    best = total
+                    meeting = current
+
+            # The edges between current and higher ranked vertices that lead towards it are the
+            # ones the other side follows upwards
+            side_distance = distance[side]
+            other = sides[1 - side]
+            if any(
+                side_distance.get(other.targets[e], float("inf")) + other.weights[e]
+                < current_dist
+                for e in range(other.offsets[current], other.offsets[current + 1])
+            ):
+                continue
+
+            graph = sides[side]
+            for e in range(graph.offsets[current], graph.offsets[current + 1]):
+                neighbour = graph.targets[e]
+                new_distance = current_dist + graph.weights[e]
+                if new_distance < side_distance.get(neighbour, float("inf")):
+                    side_distance[neighbour] = new_distance
+                    previous[side][neighbour] = (current, e)
+                    heapq.heappush(queues[side], (new_distance, neighbour))
+
+        self.last_settled = settled
+        if meeting == -1:
+            return float("inf"), []
+
+        # Collect the CH edges source -> meeting -> target as (from, to, middle)
+        forward: list[tuple[int, int, int]] = []
+        current = meeting
+        while previous[0][current][0] != -1:
+            before, e = previous[0][current]
+            forward.append((before, current, self.up_middle[e]))
+            current = before
+        forward.reverse()
+
+        backward: list[tuple[int, int, int]] = []
+        current = meeting
+        while previous[1][current][0] != -1:
+            after, e = previous[1][current]
+            backward.append((current, after, self.down_middle[e]))
+            current = after
+
+        path = [source]
+        for edge in forward + backward:
+            self._unpack(edge, path)
+        return best, path
+
+    def _unpack(self, edge: tuple[int, int, int], path: list[int]) -> None:
+        # Replace a (possibly nested) shortcut by the original edges it stands for,
+        # appending every vertex after the first one to path
+        stack = [edge]
+        while stack:
+            start, end, middle = stack.pop()
+            if middle == -1:
+                path.append(end)
+            else:
+                # The second half goes on the stack first so the first half is expanded first
+                stack.append((middle, end, self._middle_of(middle, end)))
+                stack.append((start, middle, self._middle_of(start, middle)))
+
+    def _middle_of(self, start: int, end: int) -> int:
+        # Look up the edge start -> end in the hierarchy and return the vertex it skips
+        if self.rank[start] < self.rank[end]:
+            graph, middles, vertex, other = self.up, self.up_middle, start, end
+        else:
+            graph, middles, vertex, other = self.down, self.down_middle, end, start
+        for e in range(graph.offsets[vertex], graph.offsets[vertex + 1]):
+            if graph.targets[e] == other:
+                return middles[e]
+        raise ValueError(f"Edge {start} -> {end} is not in the hierarchy.")
+
+    def get_path(self, source: str, destination: str) -> list[str] | None:
+        # Same output as DijkstraAlgorithm.get_path, answered from the hierarchy
+        if source not in self.graph or destination not in self.graph:
+            print("Invalid graph or destination vertex does not exist.")
+            return None
+
+        total, vertices = self.query(
+            self.graph.index[source], self.graph.index[destination]
+        )
+        if total == float("inf"):
+            print(f"No path found from {source} to {destination}.")
+            return None
+        return [self.graph.names[vertex] for vertex in vertices]
+
+    def save(self, path: str) -> None:
+        # Header: magic, weight type, vertex count, graph edge count, up and down edge counts
+        # and the graph checksum. Then the ranks and both halves of the hierarchy as raw arrays.
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(b"q" if self.graph.integer_weights else b"d")
+            file.write(
+                struct.pack(
+                    "<qqqqQ",
+                    self.graph.vertex_count,
+                    self.graph.edge_count,
+                    self.up.edge_count,
+                    self.down.edge_count,
+                    self.graph.checksum(),
+                )
+            )
+            self.rank.tofile(file)
+            for half, middles in (
+                (self.up, self.up_middle),
+                (self.down, self.down_middle),
+            ):
+                half.offsets.tofile(file)
+                half.targets.tofile(file)
+                half.weights.tofile(file)
+                middles.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, graph: CSRGraph) -> "ContractionHierarchy":
+        # Load a saved hierarchy for graph, ready to answer queries without any preprocessing
+        with open(path, "rb") as file:
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"'{path}' is not a contraction hierarchy file.")
+            typecode = file.read(1).decode()
+            header = file.read(40)
+            if len(header) != 40:
+                raise ValueError(f"'{path}' is not a contraction hierarchy file.")
+            vertex_count, edge_count, up_count, down_count, checksum = struct.unpack(
+                "<qqqqQ", header
+            )
+            # A changed weight keeps the counts but makes the shortcuts wrong
+            if (
+                vertex_count != graph.vertex_count
+                or edge_count != graph.edge_count
+                or checksum != graph.checksum()
+            ):
+                raise ValueError(f"'{path}' was built for a different graph.")
+
+            def read(code: str, count: int) -> array:
+                values = array(code)
+                values.fromfile(file, count)
+                return values
+
+            rank = read("q", vertex_count)
+            halves = []
+            for count in (up_count, down_count):
+                offsets = read("q", vertex_count + 1)
+                targets = read("q", count)
+                weights = read(typecode, count)
+                middles = read("q", count)
+                halves.append(
+                    (
+                        CSRGraph(graph.names, offsets, targets, weights, graph.index),
+                        middles,
+                    )
+                )
+
+        (up, up_middle), (down, down_middle) = halves
+        return cls(graph, rank, up, up_middle, down, down_middle)
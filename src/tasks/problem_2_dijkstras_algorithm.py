@@ -1,3 +1,21 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Callable, Iterator
+
+# Graphs with fewer vertices than this always use the MinHeap when the queue is picked automatically
+BUCKET_MIN_VERTICES = 1000
+
+# Dial's cursor steps through every distance up to the farthest vertex, in the worst case the
+# largest weight times V - 1 hops. The automatic choice only uses it while that stays within
+# this many steps per vertex and edge, otherwise a long path of heavy edges makes it crawl.
+DIAL_STEPS_PER_ITEM = 4
+
+
 class MinHeap:
     """
     A simple min-heap implementation for priority queue functionality.
@@ -6,16 +24,16 @@ class MinHeap:
     """
 
     def __init__(self) -> None:
-        self.heap: list[tuple[float, str]] = []
+        self.heap: list[tuple[float, int]] = []
         self.size: int = 0
 
-    def insert(self, item: tuple[float, str]) -> None:
+    def insert(self, item: tuple[float, int]) -> None:
         # Insert item while maintaining the heap property.
         self.heap.append(item)
         self.size += 1
         self._heapify_up(self.size - 1)
 
-    def extract_min(self) -> tuple[float, str] | None:
+    def extract_min(self) -> tuple[float, int] | None:
         # Extract the minimum item from the heap.
         if self.size == 0:
             return None
@@ -59,6 +77,722 @@ class MinHeap:
             self._heapify_down(smallest)
 
 
+class IndexedMinHeap:
+    """
+    A d-ary min-heap of vertex ids that tracks the position of every vertex (an indexed priority queue).
+    Because it knows where a vertex is, a shorter distance lowers the existing entry (decrease_key)
+    instead of adding a duplicate, so the heap never holds more than one entry per vertex.
+    Sifting is iterative and moves a "hole" instead of swapping tuples. With arity 4 the tree is
+    half as deep as a binary heap, which makes decrease_key and insert cheaper.
+    SOURCE: https://en.wikipedia.org/wiki/D-ary_heap
+    SOURCE: https://algs4.cs.princeton.edu/24pq/IndexMinPQ.java.html
+    """
+
+    def __init__(self, capacity: int, arity: int = 4) -> None:
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2.")
+        self.arity = arity
+        self.keys: list[float] = []  # Priority of the entry at each heap position
+        self.vertices: list[int] = []  # Vertex of the entry at each heap position
+        self.position = (
+            array("q", [-1]) * capacity
+        )  # Heap position of each vertex, -1 if absent
+        self.size: int = 0
+
+    def insert(self, item: tuple[float, int]) -> None:
+        # Insert a vertex, or lower its priority if it is already in the heap
+        priority, vertex = item
+        if self.position[vertex] != -1:
+            self.decrease_key(vertex, priority)
+            return
+
+        self.keys.append(priority)
+        self.vertices.append(vertex)
+        self.size += 1
+        self._sift_up(self.size - 1, priority, vertex)
+
+    def decrease_key(self, vertex: int, priority: float) -> None:
+        index = self.position[vertex]
+        if index == -1 or priority >= self.keys[index]:
+            return
+        self._sift_up(index, priority, vertex)
+
+    def extract_min(self) -> tuple[float, int] | None:
+        if self.size == 0:
+            return None
+
+        min_item = (self.keys[0], self.vertices[0])
+        self.position[self.vertices[0]] = -1
+
+        last_key = self.keys.pop()
+        last_vertex = self.vertices.pop()
+        self.size -= 1
+        if self.size > 0:
+            self._sift_down(0, last_key, last_vertex)
+
+        return min_item
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __contains__(self, vertex: int) -> bool:
+        return self.position[vertex] != -1
+
+    def _sift_up(self, index: int, priority: float, vertex: int) -> None:
+        # Move parents down into the hole until the entry fits, then place it once
+        keys = self.keys
+        vertices = self.vertices
+        position = self.position
+        while index > 0:
+            parent = (index - 1) // self.arity
+            if keys[parent] <= priority:
+                break
+            keys[index] = keys[parent]
+            vertices[index] = vertices[parent]
+            position[vertices[index]] = index
+            index = parent
+
+        keys[index] = priority
+        vertices[index] = vertex
+        position[vertex] = index
+
+    def _sift_down(self, index: int, priority: float, vertex: int) -> None:
+        # Move the smallest child up into the hole until the entry fits, then place it once
+        keys = self.keys
+        vertices = self.vertices
+        position = self.position
+        while True:
+            first = index * self.arity + 1
+            if first >= self.size:
+                break
+
+            smallest = first
+            smallest_key = keys[first]
+            for child in range(first + 1, min(first + self.arity, self.size)):
+                if keys[child] < smallest_key:
+                    smallest = child
+                    smallest_key = keys[child]
+
+            if smallest_key >= priority:
+                break
+            keys[index] = smallest_key
+            vertices[index] = vertices[smallest]
+            position[vertices[index]] = index
+            index = smallest
+
+        keys[index] = priority
+        vertices[index] = vertex
+        position[vertex] = index
+
+
+class BucketQueue:
+    """
+    Dial's algorithm: a circular array of max_weight + 1 buckets indexed by distance.
+    Dijkstra only ever inserts keys between the last extracted key and that key plus the largest
+    edge weight, so every bucket holds a single distance and extract_min just moves a cursor
+    forward to the next non-empty bucket. Like MinHeap it is lazy, stale entries are skipped
+    by the caller. Keys must be non-negative integers.
+    SOURCE: https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants
+    """
+
+    def __init__(self, max_weight: int) -> None:
+        self.bucket_count = max_weight + 1
+        self.buckets: list[list[int]] = [[] for _ in range(self.bucket_count)]
+        self.current: int = 0  # Distance of the bucket under the cursor
+        self.size: int = 0
+
+    def insert(self, item: tuple[int, int]) -> None:
+        priority, vertex = item
+        self.buckets[priority % self.bucket_count].append(vertex)
+        self.size += 1
+
+    def extract_min(self) -> tuple[int, int] | None:
+        if self.size == 0:
+            return None
+
+        buckets = self.buckets
+        current = self.current
+        while not buckets[current % self.bucket_count]:
+            current += 1
+        self.current = current
+        self.size -= 1
+        return current, buckets[current % self.bucket_count].pop()
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+
+class RadixHeap:
+    """
+    A monotone priority queue for integer keys, for when the weights are too large for Dial's buckets.
+    An entry lives in bucket i where i is the bit length of key XOR last (the last extracted key),
+    so bucket 0 holds keys equal to last. When bucket 0 runs empty the lowest non-empty bucket is
+    emptied: its minimum becomes last and its entries spread over strictly lower buckets.
+    Every entry moves down at most 64 times, so operations cost O(log C) amortized without
+    comparing tuples like a binary heap does. Keys must be non-negative integers.
+    SOURCE: https://en.wikipedia.org/wiki/Radix_heap
+    """
+
+    def __init__(self) -> None:
+        self.buckets: list[list[tuple[int, int]]] = [[] for _ in range(65)]
+        self.last: int = 0
+        self.size: int = 0
+
+    def insert(self, item: tuple[int, int]) -> None:
+        self.buckets[(item[0] ^ self.last).bit_length()].append(item)
+        self.size += 1
+
+    def extract_min(self) -> tuple[int, int] | None:
+        if self.size == 0:
+            return None
+
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            bucket = buckets[i]
+            buckets[i] = []
+            last = min(priority for priority, _ in bucket)
+            self.last = last
+            for item in bucket:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+
+        self.size -= 1
+        return buckets[0].pop()
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+
+class CSRGraph:
+    """
+    A directed graph in compressed sparse row (CSR) form.
+    Vertex names are interned to the ints 0 ... n - 1, and the edges leaving vertex u are
+    targets[offsets[u]:offsets[u + 1]] with the matching weights. Everything lives in flat arrays
+    instead of a dict of lists of (name, weight) tuples, which is far smaller for big graphs.
+    SOURCE: https://en.wikipedia.org/wiki/Sparse_matrix#Compressed_sparse_row_(CSR,_CRS_or_Yale_format)
+    """
+
+    MAGIC = b"CSR1"
+    # Magic, 4 bytes of padding so the arrays start 8-byte aligned, vertex count, edge count,
+    # 1 for integer weights (0 for doubles) and the byte length of the names
+    HEADER = struct.Struct("<4s4xqqqq")
+
+    def __init__(
+        self,
+        names: list[str],
+        offsets: array,
+        targets: array,
+        weights: array,
+        index: dict[str, int] | None = None,
+    ) -> None:
+        self.names = names
+        self.index: dict[str, int] = (
+            index if index is not None else {name: i for i, name in enumerate(names)}
+        )
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse: CSRGraph | None = None  # Built on first use by reverse()
+        self._max_weight: float | None = None  # Found on first use by max_weight
+
+    @classmethod
+    def from_dict(cls, graph: dict[str, list[tuple[str, int]]]) -> "CSRGraph":
+        # Input adapter for the dict form used everywhere else in this file
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+
+        # A destination without its own entry still becomes a vertex (with no outgoing edges)
+        for edges in graph.values():
+            for destination, _ in edges:
+                if destination not in index:
+                    index[destination] = len(names)
+                    names.append(destination)
+
+        all_int = all(
+            isinstance(weight, int) for edges in graph.values() for _, weight in edges
+        )
+        offsets = array("q", [0])
+        targets = array("q")
+        # Integer weights stay integers so distances print the same as before
+        weights = array("q" if all_int else "d")
+        for name in names:
+            for destination, weight in graph.get(name, []):
+                targets.append(index[destination])
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edge_list(cls, path: str, delimiter: str | None = None) -> "CSRGraph":
+        # Stream an edge list file with one "source destination weight" edge per line, split on
+        # whitespace or on delimiter ("," for CSV). Blank lines, "#" comments and a header line
+        # are skipped. A repeated edge keeps its first weight, like get_user_graph does.
+        # The file is read twice so nothing but the finished CSR arrays grows with the edge
+        # count: the first pass checks every line, interns the names and counts the edges of
+        # every source, the second drops every edge straight into its slot.
+        index, counts, integer_weights = cls._count_edges(path, delimiter)
+        n = len(index)
+        offsets = array("q", [0]) * (n + 1)
+        for vertex in range(n):
+            offsets[vertex + 1] = offsets[vertex] + counts[vertex]
+        targets = array("q", [0]) * offsets[n]
+        weights = array("q" if integer_weights else "d", [0]) * offsets[n]
+
+        # The first pass rejected every bad line, so here a line is either an edge or skipped
+        parse_weight = int if integer_weights else float
+        next_slot = offsets[:-1]
+        with open(path, "r", newline="") as file:
+            for line in file:
+                fields = line.split(delimiter)
+                if len(fields) != 3 or fields[0].startswith("#"):
+                    continue
+                source, destination, weight_str = fields
+                if delimiter is not None:
+                    source = source.strip()
+                    destination = destination.strip()
+                try:
+                    weight = parse_weight(weight_str)
+                except ValueError:
+                    continue  # The header line
+                u = index[source]
+                slot = next_slot[u]
+                targets[slot] = index[destination]
+                weights[slot] = weight
+                next_slot[u] = slot + 1
+
+        # Squeeze out repeated edges in place. last_source[v] remembers the last source that
+        # kept an edge to v, and the edges of one source are together, so a repeat is found
+        # with one array lookup (no hashing) and the first weight in the file wins.
+        last_source = array("q", [-1]) * n
+        kept = 0
+        for vertex in range(n):
+            start, end = offsets[vertex], offsets[vertex + 1]
+            offsets[vertex] = kept
+            for e in range(start, end):
+                target = targets[e]
+                if last_source[target] == vertex:
+                    continue
+                last_source[target] = vertex
+                targets[kept] = target
+                weights[kept] = weights[e]
+                kept += 1
+        offsets[n] = kept
+        del targets[kept:]
+        del weights[kept:]
+
+        return cls(list(index), offsets, targets, weights, index)
+
+    @staticmethod
+    def _count_edges(
+        path: str, delimiter: str | None
+    ) -> tuple[dict[str, int], array, bool]:
+        # First pass of from_edge_list: the vertex ids, the number of edges of every vertex
+        # (repeats included) and whether all weights are integers. Raises ValueError on a bad line.
+        index: dict[str, int] = {}
+        counts = array("q")
+        integer_weights = True
+        edges = 0
+
+        # This loop runs once per edge, so the common case is kept to a split, an int() and
+        # two dict lookups; blank lines, comments and float weights take the slow branches
+        intern = index.setdefault
+        with open(path, "r", newline="") as file:
+            for line_number, line in enumerate(file, 1):
+                fields = line.split(delimiter)
+                if len(fields) != 3 or fields[0].startswith("#"):
+                    stripped = line.strip()
+                    if not stripped or stripped.startswith("#"):
+                        continue
+                    raise ValueError(
+                        f"Line {line_number} of '{path}' is not 'source destination weight'."
+                    )
+                source, destination, weight_str = fields
+                if delimiter is not None:
+                    source = source.strip()
+                    destination = destination.strip()
+
+                try:
+                    weight = int(weight_str)
+                except ValueError:
+                    try:
+                        weight = float(weight_str)
+                    except ValueError:
+                        if not edges:
+                            continue  # A header line such as "source,destination,weight"
+                        raise ValueError(
+                            f"Invalid weight '{weight_str.strip()}' on line {line_number} of '{path}'."
+                        )
+                    integer_weights = False
+                if weight < 0:
+                    raise ValueError(
+                        f"Negative weight found: {weight} for edge {source} -> {destination}."
+                    )
+
+                u = intern(source, len(index))
+                intern(destination, len(index))
+                if len(counts) < len(index):
+                    counts.extend(array("q", [0]) * (len(index) - len(counts)))
+                counts[u] += 1
+                edges += 1
+
+        return index, counts, integer_weights
+
+    def save(self, path: str) -> None:
+        # Binary snapshot: header, then offsets, targets and weights as raw 8-byte values
+        # and finally the names as NUL separated UTF-8
+        if any("\0" in name for name in self.names):
+            raise ValueError("Vertex names cannot contain NUL characters.")
+        names = "\0".join(self.names).encode()
+        with open(path, "wb") as file:
+            file.write(
+                self.HEADER.pack(
+                    self.MAGIC,
+                    self.vertex_count,
+                    self.edge_count,
+                    int(self.integer_weights),
+                    len(names),
+                )
+            )
+            for data in (self.offsets, self.targets, self.weights):
+                file.write(memoryview(data).cast("B"))
+            file.write(names)
+
+    @classmethod
+    def load(cls, path: str, memory_map: bool = False) -> "CSRGraph":
+        # Load a snapshot written by save. Only the names are decoded, the arrays are read
+        # as they are, or with memory_map mapped read-only so they are paged in on first use.
+        with open(path, "rb") as file:
+            header = file.read(cls.HEADER.size)
+            if len(header) != cls.HEADER.size or header[:4] != cls.MAGIC:
+                raise ValueError(f"'{path}' is not a graph snapshot file.")
+            _, vertex_count, edge_count, integer_weights, names_length = (
+                cls.HEADER.unpack(header)
+            )
+            # The counts decide how much of the file every array covers, so a truncated or
+            # corrupt file must be caught here and not as an IndexError in some later search
+            expected_size = cls.HEADER.size + 8 * (vertex_count + 1 + 2 * edge_count)
+            if (
+                min(vertex_count, edge_count, names_length) < 0
+                or os.fstat(file.fileno()).st_size != expected_size + names_length
+            ):
+                raise ValueError(f"'{path}' is truncated or corrupt.")
+            weight_code = "q" if integer_weights else "d"
+            layout = (
+                ("q", vertex_count + 1),
+                ("q", edge_count),
+                (weight_code, edge_count),
+            )
+
+            sections: list[array | memoryview] = []
+            if memory_map:
+                data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                position = cls.HEADER.size
+                for code, length in layout:
+                    sections.append(data[position : position + length * 8].cast(code))
+                    position += length * 8
+                names_data = bytes(data[position : position + names_length])
+            else:
+                for code, length in layout:
+                    section = array(code)
+                    section.fromfile(file, length)
+                    sections.append(section)
+                names_data = file.read(names_length)
+
+        names = names_data.decode().split("\0") if vertex_count else []
+        if len(names) != vertex_count:
+            raise ValueError(f"'{path}' is truncated or corrupt.")
+        return cls(names, *sections)
+
+    def to_dict(self) -> dict[str, list[tuple[str, int]]]:
+        graph: dict[str, list[tuple[str, int]]] = {}
+        for u, name in enumerate(self.names):
+            graph[name] = [
+                (self.names[self.targets[e]], self.weights[e])
+                for e in range(self.offsets[u], self.offsets[u + 1])
+            ]
+        return graph
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    @property
+    def integer_weights(self) -> bool:
+        # The weights are an array, or a memoryview when they live in shared memory or a mapped file
+        return memoryview(self.weights).format == "q"
+
+    @property
+    def max_weight(self) -> float:
+        # The largest edge weight (0 without edges), scanned for once and cached.
+        # Like reverse(), the cache assumes the arrays are not changed in place afterwards.
+        if self._max_weight is None:
+            self._max_weight = max(self.weights, default=0)
+        return self._max_weight
+
+    def checksum(self) -> int:
+        # 64-bit digest of the weight type, offsets, targets and weights. Files built from the
+        # graph (landmark tables, contraction hierarchies) store it to notice a changed graph.
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(b"q" if self.integer_weights else b"d")
+        for data in (self.offsets, self.targets, self.weights):
+            digest.update(memoryview(data).cast("B"))
+        return int.from_bytes(digest.digest(), "little")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def reverse(self) -> "CSRGraph":
+        # The same graph with every edge flipped (the reverse adjacency index), built once and cached.
+        # It is filled with a counting sort on the edge targets so it is O(V + E).
+        if self._reverse is None:
+            n = self.vertex_count
+            offsets = array("q", [0]) * (n + 1)
+            for target in self.targets:
+                offsets[target + 1] += 1
+            for vertex in range(n):
+                offsets[vertex + 1] += offsets[vertex]
+
+            next_slot = offsets[:-1]
+            targets = array("q", [0]) * self.edge_count
+            weights = array("q" if self.integer_weights else "d", [0]) * self.edge_count
+            for vertex in range(n):
+                for e in range(self.offsets[vertex], self.offsets[vertex + 1]):
+                    target = self.targets[e]
+                    slot = next_slot[target]
+                    targets[slot] = vertex
+                    weights[slot] = self.weights[e]
+                    next_slot[target] = slot + 1
+
+            self._reverse = CSRGraph(self.names, offsets, targets, weights, self.index)
+            self._reverse._reverse = self
+        return self._reverse
+
+
+class FrozenGraph(CSRGraph):
+    """
+    A CSRGraph that is validated once when it is built and cannot be changed afterwards.
+    Negative weights are rejected on construction, so the solvers can trust a FrozenGraph
+    and skip both the conversion and the O(E) weight scan they do for every other graph.
+    The arrays are copied once into private read-only memoryviews, the names are a tuple and
+    the index a read-only mapping, attributes cannot be rebound, and neighbours() hands out
+    read-only views into the arrays instead of copies.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        offsets: array,
+        targets: array,
+        weights: array,
+        index: dict[str, int] | None = None,
+    ) -> None:
+        super().__init__(
+            tuple(names),
+            self._read_only(offsets),
+            self._read_only(targets),
+            self._read_only(weights),
+            MappingProxyType(
+                dict(index)
+                if index is not None
+                else {name: i for i, name in enumerate(names)}
+            ),
+        )
+        weights = self.weights
+        if len(weights) > 0 and min(weights) < 0:
+            for vertex in range(len(names)):
+                for e in range(offsets[vertex], offsets[vertex + 1]):
+                    if weights[e] < 0:
+                        raise ValueError(
+                            f"Negative weight found: {weights[e]} for edge "
+                            f"{names[vertex]} -> {names[targets[e]]}."
+                        )
+        self._frozen = True
+
+    @classmethod
+    def freeze(
+        cls, graph: dict[str, list[tuple[str, int]]] | CSRGraph
+    ) -> "FrozenGraph":
+        if isinstance(graph, FrozenGraph):
+            return graph
+        if isinstance(graph, CSRGraph):
+            return cls(
+                graph.names, graph.offsets, graph.targets, graph.weights, graph.index
+            )
+        return cls.from_dict(graph)
+
+    @staticmethod
+    def _read_only(data: array | memoryview) -> memoryview:
+        # A read-only view of data, copied first unless it is read-only already (a mapped
+        # snapshot), so nobody holding the original array can change the frozen graph
+        view = memoryview(data)
+        if not view.readonly:
+            copy = array(view.format)
+            copy.frombytes(view.cast("B"))
+            view = memoryview(copy)
+        return view.toreadonly()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # The reverse graph and the largest weight are caches, everything else is fixed once
+        # the graph is frozen
+        if getattr(self, "_frozen", False) and name not in ("_reverse", "_max_weight"):
+            raise AttributeError("FrozenGraph is read-only.")
+        super().__setattr__(name, value)
+
+    def neighbours(self, vertex: int) -> tuple[memoryview, memoryview]:
+        # Read-only (targets, weights) views of the edges leaving vertex, nothing is copied
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return (
+            memoryview(self.targets)[start:end].toreadonly(),
+            memoryview(self.weights)[start:end].toreadonly(),
+        )
+
+
+class ShortestPathTree(Mapping):
+    """
+    The result of a single source search: the distance and previous arrays, kept as they are.
+    It is a read-only mapping of vertex name -> path (an empty list when unreachable), but a path
+    is only built when it is looked up, so holding the result is O(V) instead of O(V x depth).
+    iter_path streams a path, and depth, first_hop and subtree answer the usual tree questions
+    without building any path at all. The per-vertex tables behind them are filled on first use.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        source: int,
+        distance: list[float] | array,
+        previous: array,
+        index: dict[str, int] | None = None,
+    ) -> None:
+        self.names = names
+        # Pass the graph's index along, building a new one would cost O(V) per result
+        self.index: dict[str, int] = (
+            index if index is not None else {name: i for i, name in enumerate(names)}
+        )
+        self.source = source
+        self.distance = distance
+        self.previous = previous
+        self._depth: array | None = None
+        self._first_hop: array | None = None
+        self._children: tuple[array, array] | None = None
+
+    def __getitem__(self, name: str) -> list[str]:
+        # Materialize one full path, the way solve_with_paths used to return every path
+        return list(self.iter_path(name))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def distances(self) -> dict[str, float]:
+        return {name: self.distance[i] for i, name in enumerate(self.names)}
+
+    def walk_back(self, name: str) -> Iterator[str]:
+        # Yield the path from name back to the source, one predecessor at a time
+        current = self.index[name]
+        if self.distance[current] == float("inf"):
+            return
+        while current != -1:
+            yield self.names[current]
+            current = self.previous[current]
+
+    def iter_path(self, name: str) -> Iterator[str]:
+        # Yield the path from the source to name. The predecessors point backwards, so the
+        # vertex ids (8 bytes each, no names or lists) are collected first and then replayed.
+        current = self.index[name]
+        if self.distance[current] == float("inf"):
+            return
+        hops = array("q")
+        while current != -1:
+            hops.append(current)
+            current = self.previous[current]
+        for vertex in reversed(hops):
+            yield self.names[vertex]
+
+    def depth(self, name: str) -> int:
+        # Number of edges on the path to name, -1 if it is unreachable
+        if self._depth is None:
+            self._depth = self._fill_down(0, lambda parent, vertex: parent + 1)
+        return self._depth[self.index[name]]
+
+    def first_hop(self, name: str) -> str | None:
+        # The vertex right after the source on the path to name (None for the source itself)
+        if self._first_hop is None:
+            self._first_hop = self._fill_down(
+                -1, lambda parent, vertex: vertex if parent == -1 else parent
+            )
+        hop = self._first_hop[self.index[name]]
+        return self.names[hop] if hop != -1 else None
+
+    def subtree(self, name: str) -> Iterator[str]:
+        # Yield every vertex whose shortest path passes through name, name itself first
+        if self._children is None:
+            self._children = self._build_children()
+        offsets, children = self._children
+
+        vertex = self.index[name]
+        if self.distance[vertex] == float("inf"):
+            return
+        stack = [vertex]
+        while stack:
+            current = stack.pop()
+            yield self.names[current]
+            stack.extend(children[offsets[current] : offsets[current + 1]])
+
+    def _fill_down(self, root_value: int, step: Callable[[int, int], int]) -> array:
+        # Fill a per-vertex table top-down along the tree: table[source] = root_value and
+        # table[v] = step(table[previous[v]], v). Every vertex walks up only until it reaches
+        # a vertex that is already filled, so the whole table takes O(V).
+        unknown = -2
+        table = array("q", [unknown]) * len(self.names)
+        table[self.source] = root_value
+        for vertex in range(len(self.names)):
+            if self.distance[vertex] == float("inf"):
+                table[vertex] = -1
+                continue
+            chain = []
+            current = vertex
+            while table[current] == unknown:
+                chain.append(current)
+                current = self.previous[current]
+            value = table[current]
+            for current in reversed(chain):
+                value = step(value, current)
+                table[current] = value
+        return table
+
+    def _build_children(self) -> tuple[array, array]:
+        # The tree edges in CSR form (children of every vertex), grouped with a counting sort
+        n = len(self.names)
+        offsets = array("q", [0]) * (n + 1)
+        for vertex in range(n):
+            if self.previous[vertex] != -1:
+                offsets[self.previous[vertex] + 1] += 1
+        for vertex in range(n):
+            offsets[vertex + 1] += offsets[vertex]
+
+        next_slot = offsets[:-1]
+        children = array("q", [0]) * offsets[n]
+        for vertex in range(n):
+            parent = self.previous[vertex]
+            if parent != -1:
+                children[next_slot[parent]] = vertex
+                next_slot[parent] += 1
+        return offsets, children
+
+
 """
 Sources used in learning about Dijkstra's Algorithm:
 SOURCE: https://www.datacamp.com/tutorial/dijkstra-algorithm-in-python
@@ -66,43 +800,128 @@ SOURCE: https://www.datacamp.com/tutorial/dijkstra-algorithm-in-python
 
 
 class DijkstraAlgorithm:
+    """
+    Every solver accepts either the dict form (vertex -> list of (neighbour, weight)) or a CSRGraph.
+    The dict form is converted to a CSRGraph first, the search itself always runs on vertex ids
+    with list/array indexed distance and predecessor storage. A FrozenGraph is used as it is
+    without converting or scanning it again, so repeated queries on one graph should freeze it once.
+
+    queue picks the priority queue: "lazy" is the MinHeap with one entry per relaxation
+    (stale entries are skipped when popped), "indexed" is an IndexedMinHeap of the given arity
+    that uses decrease_key and stays at one entry per vertex. "dial" (BucketQueue) and "radix"
+    (RadixHeap) need integer weights. "auto" picks per graph: a bucket queue for big graphs with
+    integer weights (Dial's when the largest weight is small), the MinHeap otherwise.
+    """
+
+    def __init__(self, queue: str = "auto", arity: int = 4) -> None:
+        if queue not in ("auto", "lazy", "indexed", "dial", "radix"):
+            raise ValueError(f"Unknown priority queue: {queue}")
+        self.queue = queue
+        self.arity = arity
+        # Number of vertices the last search settled, to compare how much work each method does
+        self.last_settled: int = 0
+
+    def _make_queue(
+        self, graph: CSRGraph
+    ) -> MinHeap | IndexedMinHeap | BucketQueue | RadixHeap:
+        queue = self._choose_queue(graph) if self.queue == "auto" else self.queue
+        if queue in ("dial", "radix") and not graph.integer_weights:
+            raise ValueError(f"The {queue} queue needs integer edge weights.")
+
+        if queue == "dial":
+            return BucketQueue(graph.max_weight)
+        if queue == "radix":
+            return RadixHeap()
+        if queue == "indexed":
+            return IndexedMinHeap(graph.vertex_count, self.arity)
+        return MinHeap()
+
+    def _choose_queue(self, graph: CSRGraph) -> str:
+        # Bucket queues need integer weights, and on small graphs the MinHeap is just as fast
+        if not graph.integer_weights or graph.vertex_count < BUCKET_MIN_VERTICES:
+            return "lazy"
+        # Dial's cursor walks over every distance up to the farthest vertex, so it is only
+        # safe when even a path through all vertices cannot make that walk long
+        cursor_steps = graph.max_weight * (graph.vertex_count - 1)
+        if cursor_steps <= DIAL_STEPS_PER_ITEM * (
+            graph.vertex_count + graph.edge_count
+        ):
+            return "dial"
+        return "radix"
 
     def solve(
-        self, graph: dict[str, list[tuple[str, int]]], source: str
+        self, graph: dict[str, list[tuple[str, int]]] | CSRGraph, source: str
     ) -> dict[str, float] | None:
         # Validate the graph before solving
         if not self._is_valid_graph(graph, source):
             return None
 
-        # To avoid mutating the original graph, we create a copy
-        graph_copy: dict[str, list[tuple[str, int]]] = {}
-        for vertex, edges in graph.items():
-            graph_copy[vertex] = edges[:]
+        # Converting to a CSRGraph also means the original graph is never mutated
+        csr = self._as_csr(graph)
+        distance, _ = self._dijkstra(csr, csr.index[source], verbose=True)
 
-        distances = self._dijkstra(graph_copy, source)
+        distances = {name: distance[i] for i, name in enumerate(csr.names)}
         return distances if distances else None
 
     def solve_with_paths(
-        self, graph: dict[str, list[tuple[str, int]]], source: str
-    ) -> tuple[dict[str, float], dict[str, list[str]]] | None:
-        # Show the complete path when solving Dijkstra's algorithm
+        self, graph: dict[str, list[tuple[str, int]]] | CSRGraph, source: str
+    ) -> tuple[dict[str, float], ShortestPathTree] | None:
+        # Show the complete path when solving Dijkstra's algorithm.
+        # The paths come back as a ShortestPathTree, which builds a path only when it is asked for.
         if not self._is_valid_graph(graph, source):
             return None
-        graph_copy: dict[str, list[tuple[str, int]]] = {}
-        for vertex, edges in graph.items():
-            graph_copy[vertex] = edges[:]
-
-        distances, previous = self._solve_with_path(graph_copy, source)
-
-        # Add all the complete paths
-        paths: dict[str, list[str]] = {}
-        for vertex in graph_copy:
-            if distances[vertex] == float("inf"):
-                paths[vertex] = []
-            else:
-                paths[vertex] = self._reconstruct_path(previous, vertex)
-
-        return distances, paths
+        csr = self._as_csr(graph)
+
+        distance, previous = self._dijkstra(csr, csr.index[source])
+        tree = ShortestPathTree(
+            csr.names, csr.index[source], distance, previous, csr.index
+        )
+        return tree.distances(), tree
+
+    def nearest_facility(
+        self, graph: dict[str, list[tuple[str, int]]] | CSRGraph, facilities: list[str]
+    ) -> tuple[dict[str, float], dict[str, str | None]] | None:
+        # Distance from every vertex to its nearest facility and which facility that is,
+        # found with one multi-source search instead of one search per facility
+        if not facilities:
+            print("No facilities given.")
+            return None
+        # The graph itself only needs checking once, the other facilities just have to exist
+        if not self._is_valid_graph(graph, facilities[0]):
+            return None
+        for facility in facilities[1:]:
+            if facility not in graph:
+                print(f"Source vertex '{facility}' does not exist in the graph.")
+                return None
+        csr = self._as_csr(graph)
+
+        distance, previous = self._dijkstra(
+            csr, [csr.index[facility] for facility in facilities]
+        )
+
+        # The facility of a vertex is the root of its branch in the shortest path forest.
+        # Walk up only until a vertex with a known root, so this stays O(V) overall.
+        root = array("q", [-2]) * csr.vertex_count
+        for vertex in range(csr.vertex_count):
+            if distance[vertex] == float("inf"):
+                root[vertex] = -1
+                continue
+            chain = []
+            current = vertex
+            while root[current] == -2 and previous[current] != -1:
+                chain.append(current)
+                current = previous[current]
+            found = current if root[current] == -2 else root[current]
+            root[current] = found
+            for current in chain:
+                root[current] = found
+
+        distances = {name: distance[i] for i, name in enumerate(csr.names)}
+        nearest = {
+            name: csr.names[root[i]] if root[i] != -1 else None
+            for i, name in enumerate(csr.names)
+        }
+        return distances, nearest
 
     def get_user_graph(self) -> dict[str, list[tuple[str, int]]] | None:
         print("\n=== Graph Input ===")
@@ -111,6 +930,7 @@ class DijkstraAlgorithm:
         print("Enter 'done' when finished.\n")
 
         graph: dict[str, list[tuple[str, int]]] = {}
+        edges_added: set[tuple[str, str]] = set()  # For O(1) duplicate checks
 
         # Loop to get user input for graph edges
         while True:
@@ -149,16 +969,18 @@ class DijkstraAlgorithm:
                 graph[destination] = []
 
             # Add edge to graph
-            edge_exists = any(dest == destination for dest, _ in graph[source])
-            if edge_exists:
+            if (source, destination) in edges_added:
                 print(f"Edge {source} -> {destination} already exists.")
                 continue
 
+            edges_added.add((source, destination))
             graph[source].append((destination, weight))
             print(f"Added edge: {source} -> {destination} (weight: {weight})")
         return graph
 
-    def print_graph(self, graph: dict[str, list[tuple[str, int]]]) -> None:
+    def print_graph(self, graph: dict[str, list[tuple[str, int]]] | CSRGraph) -> None:
+        if isinstance(graph, CSRGraph):
+            graph = graph.to_dict()
         print("\n=== Graph Structure ===")
         for vertex in sorted(graph.keys()):
             edges = graph[vertex]
@@ -178,19 +1000,30 @@ class DijkstraAlgorithm:
                 print(f"{vertex}: {dist}")
 
     def print_paths(
-        self, distances: dict[str, float], paths: dict[str, list[str]], source: str
+        self,
+        distances: dict[str, float],
+        paths: ShortestPathTree | dict[str, list[str]],
+        source: str,
     ) -> None:
         # Print the shortest paths from source to all other vertices in the desired format.
+        # A ShortestPathTree is streamed, only the path being printed is ever built.
         print(f"\n=== Shortest Paths from {source} ===")
         for vertex in sorted(distances.keys()):
             if distances[vertex] == float("inf"):
                 print(f"{vertex}: unreachable")
+            elif isinstance(paths, ShortestPathTree):
+                print(f"{vertex}: {'->'.join(paths.iter_path(vertex))}")
             else:
                 path_str = "->".join(paths[vertex])
                 print(f"{vertex}: {path_str}")
 
+    def _as_csr(self, graph: dict[str, list[tuple[str, int]]] | CSRGraph) -> CSRGraph:
+        if isinstance(graph, CSRGraph):
+            return graph
+        return CSRGraph.from_dict(graph)
+
     def _is_valid_graph(
-        self, graph: dict[str, list[tuple[str, int]]], source: str
+        self, graph: dict[str, list[tuple[str, int]]] | CSRGraph, source: str
     ) -> bool:
         # Check if graph is empty or has invalid structure
         if not graph:
@@ -202,6 +1035,27 @@ class DijkstraAlgorithm:
             print(f"Source vertex '{source}' does not exist in the graph.")
             return False
 
+        if isinstance(graph, CSRGraph):
+            # A FrozenGraph was already checked for negative weights when it was built
+            if (
+                not isinstance(graph, FrozenGraph)
+                and graph.edge_count > 0
+                and min(graph.weights) < 0
+            ):
+                for vertex in range(graph.vertex_count):
+                    for e in range(graph.offsets[vertex], graph.offsets[vertex + 1]):
+                        if graph.weights[e] < 0:
+                            print(
+                                f"Negative weight found: {graph.weights[e]} for edge "
+                                f"{graph.names[vertex]} -> {graph.names[graph.targets[e]]}."
+                            )
+                            return False
+
+            if graph.edge_count == 0:
+                print("Graph has no edges.")
+                return False
+            return True
+
         # Check for negative weights
         for vertex, edges in graph.items():
             for destination, weight in edges:
@@ -221,113 +1075,285 @@ class DijkstraAlgorithm:
         return True
 
     def _dijkstra(
-        self, graph: dict[str, list[tuple[str, int]]], source: str
-    ) -> dict[str, float]:
-        # Initialize variables
-        distance: dict[str, float] = {}
-        for vertex in graph:
-            distance[vertex] = float("inf")
-        distance[source] = 0
-
-        visited: set[str] = set()
-        priority_queue = MinHeap()
-        priority_queue.insert((0, source))
-
-        print(f"\nSolving shortest path from {source}...")
+        self,
+        graph: CSRGraph,
+        source: int | list[int],
+        verbose: bool = False,
+        target: int = -1,
+    ) -> tuple[list[float], array]:
+        # Dijkstra's algorithm on vertex ids, it also tracks the previous vertex of every vertex
+        # (-1 for none) for path reconstruction. verbose narrates every step.
+        # With a target the search stops as soon as the target is settled, since its distance
+        # and path can no longer change; everything not settled by then is left unfinished.
+        # A list of sources starts them all at distance 0, as if a super source had a zero
+        # weight edge to each of them, so every vertex ends up measured from its nearest source.
+        offsets = graph.offsets
+        targets = graph.targets
+        weights = graph.weights
+        names = graph.names
+
+        distance: list[float] = [float("inf")] * graph.vertex_count
+        previous = array("q", [-1]) * graph.vertex_count
+        visited = bytearray(graph.vertex_count)
+
+        # All queues share insert/extract_min, the indexed one turns a second insert into decrease_key
+        priority_queue = self._make_queue(graph)
+        sources = [source] if isinstance(source, int) else source
+        for start in sources:
+            distance[start] = 0
+            priority_queue.insert((0, start))
+
+        if verbose:
+            print(
+                f"\nSolving shortest path from {', '.join(names[start] for start in sources)}..."
+            )
 
+        settled = 0
         while not priority_queue.is_empty():
             current = priority_queue.extract_min()
             if current is None:
                 break
 
             current_dist, current_vertex = current
-            if current_vertex in visited:
+            if visited[current_vertex]:
                 continue
 
-            visited.add(current_vertex)
-            print(f"Visiting {current_vertex} (distance: {current_dist})")
+            visited[current_vertex] = 1
+            settled += 1
+            if verbose:
+                print(f"Visiting {names[current_vertex]} (distance: {current_dist})")
+            if current_vertex == target:
+                break
 
             # Check the neighbors of the current vertex
-            for neighbour, weight in graph[current_vertex]:
-                if neighbour not in visited:
-                    new_distance = distance[current_vertex] + weight
+            for e in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbour = targets[e]
+                if not visited[neighbour]:
+                    new_distance = distance[current_vertex] + weights[e]
 
                     if new_distance < distance[neighbour]:
                         distance[neighbour] = new_distance
+                        previous[neighbour] = current_vertex
                         priority_queue.insert((new_distance, neighbour))
-                        print(f"Updating distance for {neighbour}: {new_distance}")
-
-        return distance
+                        if verbose:
+                            print(
+                                f"Updating distance for {names[neighbour]}: {new_distance}"
+                            )
 
-    def get_path(
-        self, graph: dict[str, list[tuple[str, int]]], source: str, destination: str
-    ) -> list[str] | None:
-        # Searching for the shortest path between the source and the destination
-        if not self._is_valid_graph(graph, source) or destination not in graph:
-            print("Invalid graph or destination vertex does not exist.")
-            return None
-
-        # Use Dijkstra's algorithm on the previous vertices
-        distances, previous = self._solve_with_path(graph, source)
-
-        if distances[destination] == float("inf"):
-            print(f"No path found from {source} to {destination}.")
-            return None
+        self.last_settled = settled
+        return distance, previous
 
-        # Restore the path from source to destination using the helper method
-        path = self._reconstruct_path(previous, destination)
-        return path
+    def _bidirectional_dijkstra(
+        self, graph: CSRGraph, source: int, target: int
+    ) -> tuple[float, list[int]]:
+        # Search forwards from the source and backwards (over the reverse graph) from the target
+        # at the same time, always growing the smaller frontier. best is the shortest source -> target
+        # distance seen so far through a vertex reached from both sides, and once the two smallest
+        # queued distances add up to at least best no shorter path can exist.
+        # Distances are kept in dicts so the query only touches the vertices it reaches.
+        # SOURCE: https://www.cs.princeton.edu/courses/archive/spr06/cos423/Handouts/EPP%20shortest%20path%20algorithms.pdf
+        if source == target:
+            self.last_settled = 1
+            return 0, [source]
+
+        reverse = graph.reverse()
+        adjacency = (
+            (graph.offsets, graph.targets, graph.weights),
+            (reverse.offsets, reverse.targets, reverse.weights),
+        )
+        distance: tuple[dict[int, float], dict[int, float]] = ({source: 0}, {target: 0})
+        previous: tuple[dict[int, int], dict[int, int]] = ({source: -1}, {target: -1})
+        done: tuple[set[int], set[int]] = (set(), set())
+        queues = (MinHeap(), MinHeap())
+        queues[0].insert((0, source))
+        queues[1].insert((0, target))
+
+        best = float("inf")
+        meeting = -1
+        settled = 0
+        while not queues[0].is_empty() and not queues[1].is_empty():
+            if queues[0].heap[0][0] + queues[1].heap[0][0] >= best:
+                break
 
-    def _solve_with_path(
-        self, graph: dict[str, list[tuple[str, int]]], source: str
-    ) -> tuple[dict[str, float], dict[str, str | None]]:
-        # A modified version of Dijkstra's algorithm that also tracks the previous vertices for path reconstruction
-        distance: dict[str, float] = {}
-        previous: dict[str, str | None] = {}
-        for vertex in graph:
-            distance[vertex] = float("inf")
-            previous[vertex] = None
-        distance[source] = 0
-
-        visited: set[str] = set()
+            side = 0 if queues[0].size <= queues[1].size else 1
+            other = 1 - side
+            current_dist, current_vertex = queues[side].extract_min()
+            if current_vertex in done[side]:
+                continue
+            done[side].add(current_vertex)
+            settled += 1
+
+            offsets, targets, weights = adjacency[side]
+            side_distance = distance[side]
+            other_distance = distance[other]
+            for e in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbour = targets[e]
+                new_distance = current_dist + weights[e]
+                if new_distance < side_distance.get(neighbour, float("inf")):
+                    side_distance[neighbour] = new_distance
+                    previous[side][neighbour] = current_vertex
+                    queues[side].insert((new_distance, neighbour))
+
+                # The neighbour was reached from the other side too, so this is a full path
+                if neighbour in other_distance:
+                    total = side_distance[neighbour] + other_distance[neighbour]
+                    if total < best:
+                        best = total
+                        meeting = neighbour
+
+        self.last_settled = settled
+        if meeting == -1:
+            return float("inf"), []
+
+        # Forward half from the source to the meeting vertex, then the backward half to the target
+        path: list[int] = []
+        current = meeting
+        while current != -1:
+            path.append(current)
+            current = previous[0][current]
+        path.reverse()
+        current = previous[1][meeting]
+        while current != -1:
+            path.append(current)
+            current = previous[1][current]
+        return best, path
+
+    def _astar(
+        self,
+        graph: CSRGraph,
+        source: int,
+        target: int,
+        heuristic: Callable[[int], float],
+    ) -> tuple[float, list[int]]:
+        # A* search: the queue is ordered by distance + heuristic(vertex), an estimate of the
+        # remaining distance to the target, so vertices in the direction of the target come first.
+        # The heuristic must never overestimate (admissible), returning inf means the target
+        # cannot be reached from that vertex. A vertex reached again with a shorter distance is
+        # re-opened, so heuristics that are admissible but not consistent still give shortest paths.
+        # SOURCE: https://en.wikipedia.org/wiki/A*_search_algorithm
+        offsets = graph.offsets
+        targets = graph.targets
+        weights = graph.weights
+
+        distance: dict[int, float] = {source: 0}
+        previous: dict[int, int] = {source: -1}
+        estimate: dict[int, float] = {source: heuristic(source)}
+        queued: dict[int, float] = {
+            source: estimate[source]
+        }  # Latest queue priority per vertex
         priority_queue = MinHeap()
-        priority_queue.insert((0, source))
+        priority_queue.insert((estimate[source], source))
 
+        settled = 0
+        found = False
         while not priority_queue.is_empty():
-            current = priority_queue.extract_min()
-            if current is None:
+            priority, current_vertex = priority_queue.extract_min()
+            if queued.get(current_vertex) != priority:
+                continue  # A stale entry, the vertex was queued again with a lower priority
+            del queued[current_vertex]
+            settled += 1
+            if current_vertex == target:
+                found = True
                 break
 
-            _, current_vertex = current
-            if current_vertex in visited:
-                continue
+            current_dist = distance[current_vertex]
+            for e in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbour = targets[e]
+                new_distance = current_dist + weights[e]
+                if new_distance < distance.get(neighbour, float("inf")):
+                    if neighbour not in estimate:
+                        estimate[neighbour] = heuristic(neighbour)
+                    if estimate[neighbour] == float("inf"):
+                        continue  # The target is not reachable from there
+                    distance[neighbour] = new_distance
+                    previous[neighbour] = current_vertex
+                    queued[neighbour] = new_distance + estimate[neighbour]
+                    priority_queue.insert((queued[neighbour], neighbour))
+
+        self.last_settled = settled
+        if not found:
+            return float("inf"), []
+
+        path: list[int] = []
+        current = target
+        while current != -1:
+            path.append(current)
+            current = previous[current]
+        path.reverse()
+        return distance[target], path
 
-            visited.add(current_vertex)
+    def get_path(
+        self,
+        graph: dict[str, list[tuple[str, int]]] | CSRGraph,
+        source: str,
+        destination: str,
+        method: str = "dijkstra",
+        heuristic: "Callable[[str, str], float] | Landmarks | None" = None,
+    ) -> list[str] | None:
+        # Searching for the shortest path between the source and the destination.
+        # method is "dijkstra" (stops once the destination is settled), "bidirectional" or "astar".
+        # For "astar", heuristic is either a function (vertex, destination) -> lower bound on the
+        # remaining distance, or Landmarks built for this graph (ALT). Without one A* is Dijkstra.
+        if not self._is_valid_graph(graph, source) or destination not in graph:
+            print("Invalid graph or destination vertex does not exist.")
+            return None
 
-            for neighbour, weight in graph[current_vertex]:
-                if neighbour not in visited:
-                    new_distance = distance[current_vertex] + weight
+        csr = self._as_csr(graph)
+        start = csr.index[source]
+        target = csr.index[destination]
 
-                    if new_distance < distance[neighbour]:
-                        distance[neighbour] = new_distance
-                        previous[neighbour] = current_vertex
-                        priority_queue.insert((new_distance, neighbour))
+        if method == "dijkstra":
+            # Use Dijkstra's algorithm on the previous vertices
+            distance, previous = self._dijkstra(csr, start, target=target)
+            if distance[target] == float("inf"):
+                print(f"No path found from {source} to {destination}.")
+                return None
 
-        return distance, previous
+            # Restore the path from source to destination using the helper method
+            return self._reconstruct_path(csr, previous, target)
+
+        if method == "bidirectional":
+            total, vertices = self._bidirectional_dijkstra(csr, start, target)
+        elif method == "astar":
+            total, vertices = self._astar(
+                csr, start, target, self._vertex_heuristic(csr, target, heuristic)
+            )
+        else:
+            raise ValueError(f"Unknown shortest path method: {method}")
+
+        if total == float("inf"):
+            print(f"No path found from {source} to {destination}.")
+            return None
+        return [csr.names[vertex] for vertex in vertices]
+
+    def _vertex_heuristic(
+        self,
+        graph: CSRGraph,
+        target: int,
+        heuristic: "Callable[[str, str], float] | Landmarks | None",
+    ) -> Callable[[int], float]:
+        # Turn the user facing heuristic into one on vertex ids for a fixed target
+        if heuristic is None:
+            return lambda vertex: 0
+        if isinstance(heuristic, Landmarks):
+            return lambda vertex: heuristic.lower_bound(vertex, target)
+        names = graph.names
+        destination = names[target]
+        return lambda vertex: heuristic(names[vertex], destination)
 
     def _reconstruct_path(
-        self, previous: dict[str, str | None], destination: str
+        self, graph: CSRGraph, previous: array, destination: int
     ) -> list[str]:
         """
         Reconstruct the shortest path from source to destination using the previous vertices.
-        This method traces back from destination to source using the previous dictionary.
+        This method traces back from destination to source using the previous array.
         """
         path: list[str] = []
         current = destination
 
         # Trace back from destination to source
-        while current is not None:
-            path.append(current)
+        while current != -1:
+            path.append(graph.names[current])
             current = previous[current]
 
         # Reverse the path to get source -> destination order
@@ -335,6 +1361,167 @@ class DijkstraAlgorithm:
         return path
 
 
+class Landmarks:
+    """
+    ALT (A*, Landmarks and Triangle inequality) preprocessing.
+    For a few landmark vertices L the distances from L and to L are stored for every vertex.
+    By the triangle inequality d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L),
+    so the largest of these over all landmarks is a lower bound A* can use as its heuristic.
+    The tables can be saved to a file so a process can load them instead of recomputing them.
+    SOURCE: https://www.microsoft.com/en-us/research/publication/computing-the-shortest-path-a-search-meets-graph-theory/
+    """
+
+    MAGIC = b"ALT2"
+    # Vertex count, edge count, landmark count and the checksum of the graph
+    HEADER = struct.Struct("<qqqQ")
+
+    def __init__(
+        self,
+        graph: CSRGraph,
+        landmarks: list[int],
+        from_tables: list[array],
+        to_tables: list[array],
+    ) -> None:
+        self.graph = graph
+        self.landmarks = landmarks
+        self.from_tables = from_tables  # from_tables[i][v] is d(landmarks[i], v)
+        self.to_tables = to_tables  # to_tables[i][v] is d(v, landmarks[i])
+
+    @classmethod
+    def build(
+        cls,
+        graph: CSRGraph,
+        count: int = 8,
+        solver: DijkstraAlgorithm | None = None,
+    ) -> "Landmarks":
+        # Pick landmarks with the farthest selection heuristic: every new landmark is the vertex
+        # farthest from the ones chosen so far, which spreads them around the edge of the graph.
+        solver = solver if solver is not None else DijkstraAlgorithm("indexed")
+        reverse = graph.reverse()
+        count = min(count, graph.vertex_count)
+
+        landmarks: list[int] = []
+        from_tables: list[array] = []
+        to_tables: list[array] = []
+        closest = [
+            float("inf")
+        ] * graph.vertex_count  # Distance to the nearest chosen landmark
+
+        # Start from the vertex farthest away from vertex 0
+        distance, _ = solver._dijkstra(graph, 0)
+        candidate = cls._farthest(distance)
+        while len(landmarks) < count and candidate != -1:
+            landmarks.append(candidate)
+            distance, _ = solver._dijkstra(graph, candidate)
+            from_tables.append(array("d", distance))
+            to_distance, _ = solver._dijkstra(reverse, candidate)
+            to_tables.append(array("d", to_distance))
+
+            for vertex in range(graph.vertex_count):
+                if distance[vertex] < closest[vertex]:
+                    closest[vertex] = distance[vertex]
+            candidate = cls._farthest(closest, exclude=landmarks)
+
+        return cls(graph, landmarks, from_tables, to_tables)
+
+    @staticmethod
+    def _farthest(distance: list[float], exclude: list[int] | None = None) -> int:
+        # Vertex with the largest finite distance (an unreached vertex is preferred), -1 if none
+        excluded = set(exclude or [])
+        best = -1
+        best_distance = -1.0
+        for vertex, dist in enumerate(distance):
+            if vertex in excluded:
+                continue
+            if dist == float("inf"):
+                dist = float(
+                    "1e308"
+                )  # Not covered by any landmark yet, the best candidate
+            if dist > best_distance:
+                best = vertex
+                best_distance = dist
+        return best
+
+    def lower_bound(self, vertex: int, target: int) -> float:
+        # Largest triangle inequality bound on d(vertex, target) over all landmarks
+        inf = float("inf")
+        bound = 0.0
+        for from_landmark, to_landmark in zip(self.from_tables, self.to_tables):
+            # d(L, t) - d(L, v): if L reaches v but not t, v cannot reach t either
+            if from_landmark[vertex] != inf:
+                if from_landmark[target] == inf:
+                    return inf
+                bound = max(bound, from_landmark[target] - from_landmark[vertex])
+            # d(v, L) - d(t, L): if t reaches L but v does not, v cannot reach t either
+            if to_landmark[target] != inf:
+                if to_landmark[vertex] == inf:
+                    return inf
+                bound = max(bound, to_landmark[vertex] - to_landmark[target])
+        return bound
+
+    def save(self, path: str) -> None:
+        # Magic and header, then the landmark ids and every table as raw doubles
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(
+                self.HEADER.pack(
+                    self.graph.vertex_count,
+                    self.graph.edge_count,
+                    len(self.landmarks),
+                    self.graph.checksum(),
+                )
+            )
+            array("q", self.landmarks).tofile(file)
+            for table in self.from_tables + self.to_tables:
+                table.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, graph: CSRGraph) -> "Landmarks":
+        with open(path, "rb") as file:
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"'{path}' is not a landmark table file.")
+            header = file.read(cls.HEADER.size)
+            if len(header) != cls.HEADER.size:
+                raise ValueError(f"'{path}' is not a landmark table file.")
+            vertex_count, edge_count, count, checksum = cls.HEADER.unpack(header)
+            # The counts alone miss a changed weight or edge target, which would make the stored
+            # distances (and the A* bounds built on them) wrong
+            if (
+                vertex_count != graph.vertex_count
+                or edge_count != graph.edge_count
+                or checksum != graph.checksum()
+            ):
+                raise ValueError(f"'{path}' was built for a different graph.")
+
+            landmarks = array("q")
+            landmarks.fromfile(file, count)
+            tables: list[array] = []
+            for _ in range(2 * count):
+                table = array("d")
+                table.fromfile(file, vertex_count)
+                tables.append(table)
+
+        return cls(graph, list(landmarks), tables[:count], tables[count:])
+
+    @classmethod
+    def load_or_build(
+        cls,
+        path: str,
+        graph: CSRGraph,
+        count: int = 8,
+        solver: DijkstraAlgorithm | None = None,
+    ) -> "Landmarks":
+        # Reuse the saved tables when they match the graph, otherwise build and save them
+        if os.path.exists(path):
+            try:
+                return cls.load(path, graph)
+            except (ValueError, EOFError):
+                pass
+        landmarks = cls.build(graph, count, solver)
+        landmarks.save(path)
+        return landmarks
+
+
 def problem_2():
     print("Problem 2: Dijkstra's Algorithm")
 
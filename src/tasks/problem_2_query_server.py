@@ -0,0 +1,353 @@
+import asyncio
+import json
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Awaitable, Callable
+
+from tasks.problem_2_batch_paths import (
+    DISTANCE_CODE,
+    attach_graph,
+    share_graph,
+    solve_path,
+    solve_tree,
+)
+from tasks.problem_2_dijkstras_algorithm import (
+    CSRGraph,
+    DijkstraAlgorithm,
+    FrozenGraph,
+)
+from tasks.problem_3_batch_sudoku import LatencyHistogram
+
+DEFAULT_PORT = 8765
+
+# Searches allowed to run or wait for a worker at once, further requests wait before queueing
+MAX_PENDING_SEARCHES = 64
+
+# Longest request line a client may send, in bytes
+MAX_REQUEST_SIZE = 64 * 1024
+
+# What a worker process needs to encode responses, set once per worker
+_names: tuple[str, ...] = ()
+_integer_weights = False
+
+
+def _start_worker(
+    names: tuple[str, ...],
+    blocks: list[tuple[str, str, int]],
+    queue: str,
+    integer_weights: bool,
+) -> None:
+    # Worker initializer: attach the shared graph and keep what _distances_response needs
+    global _names, _integer_weights
+    attach_graph(names, blocks, queue)
+    _names = names
+    _integer_weights = integer_weights
+
+
+def _distances_response(source: int) -> bytes:
+    # Worker: search from source and encode the whole {"distances": ...} response. With one entry
+    # per vertex it is the only answer big enough to stall the event loop while it is built.
+    distance_bytes, _ = solve_tree(source)
+    distance = array(DISTANCE_CODE)
+    distance.frombytes(distance_bytes)
+    inf = float("inf")
+    distances = {
+        name: None if value == inf else int(value) if _integer_weights else value
+        for name, value in zip(_names, distance)
+    }
+    return json.dumps({"distances": distances}).encode()
+
+
+class ShortestPathServer:
+    """
+    An asyncio server that loads a graph once and answers shortest path queries over a socket.
+    The protocol is one JSON object per line in each direction:
+      {"source": "A", "target": "F"} -> {"distance": 11, "path": ["A", ..., "F"]}
+      {"source": "A"}                 -> {"distances": {"A": 0, ...}}
+    Unreachable distances and paths are null, problems come back as {"error": "..."}.
+    Searches run in a process pool that maps the graph from shared memory, and the workers also
+    build and encode the all-distances responses, so the event loop only handles small JSON objects.
+    Requests that are already being searched for wait for that search instead of starting another
+    one, and at most max_pending searches are in flight.
+    SOURCE: https://docs.python.org/3/library/asyncio-stream.html
+    """
+
+    def __init__(
+        self,
+        graph: dict[str, list[tuple[str, int]]] | CSRGraph,
+        workers: int | None = None,
+        max_pending: int = MAX_PENDING_SEARCHES,
+    ) -> None:
+        # Validate once up front, the workers trust the graph from then on
+        self.graph = FrozenGraph.freeze(graph)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.queue = DijkstraAlgorithm()._choose_queue(self.graph)
+
+        self.in_flight: dict[tuple[int, int], asyncio.Future] = {}
+        self.searches = 0  # Searches actually run
+        self.coalesced = 0  # Requests that shared a search already in flight
+        self._slots: asyncio.Semaphore | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._blocks = []
+        self._specs: list[tuple[str, str, int]] = []
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.Task] = set()
+
+    async def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        path: str | None = None,
+    ) -> None:
+        # Listen on host:port, or on the Unix socket at path when one is given
+        self._blocks, self._specs = share_graph(self.graph)
+        self._start_pool()
+        self._slots = asyncio.Semaphore(self.max_pending)
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_client, path, limit=MAX_REQUEST_SIZE
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_client, host, port, limit=MAX_REQUEST_SIZE
+            )
+
+    def _start_pool(self) -> None:
+        # The workers attach to the shared blocks, which outlive any one pool
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_start_worker,
+            initargs=(
+                self.graph.names,
+                self._specs,
+                self.queue,
+                self.graph.integer_weights,
+            ),
+        )
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Connections that are still open are dropped, their handlers exit quietly
+        for client in list(self._clients):
+            client.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Requests on one connection are answered in order, one at a time. Not reading the next
+        # line until the answer is written is what pushes back on a client that sends too fast.
+        client = asyncio.current_task()
+        self._clients.add(client)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"error": "Request too long."}\n')
+                    break
+                if not line:
+                    break
+
+                response = await self._answer(line)
+                if isinstance(response, dict):
+                    response = json.dumps(response).encode()
+                writer.write(response + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.discard(client)
+            writer.close()
+
+    async def _answer(self, line: bytes) -> dict | bytes:
+        # The response as a dict, or already encoded when a worker built it
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"error": "Request is not valid JSON."}
+        if not isinstance(request, dict) or "source" not in request:
+            return {"error": "Request needs a source."}
+
+        source = request["source"]
+        target = request.get("target")
+        if not isinstance(source, str) or source not in self.graph:
+            return {"error": f"Source vertex '{source}' does not exist in the graph."}
+        if target is not None and (
+            not isinstance(target, str) or target not in self.graph
+        ):
+            return {"error": f"Target vertex '{target}' does not exist in the graph."}
+
+        # A failed search fails every request waiting on it, each one answers with the error
+        try:
+            if target is None:
+                return await self._distances(self.graph.index[source])
+            distance, path = await self._path(
+                self.graph.index[source], self.graph.index[target]
+            )
+        except Exception as error:
+            return {"error": f"Search failed: {error or type(error).__name__}"}
+        return {"distance": self._distance(distance), "path": path}
+
+    def _distance(self, distance: float) -> float | None:
+        # JSON has no infinity, and integer graphs should answer with integers
+        if distance == float("inf"):
+            return None
+        return int(distance) if self.graph.integer_weights else distance
+
+    async def _path(self, source: int, target: int) -> tuple[float, list[str] | None]:
+        # The worker stops at the target and sends back only the distance and the path
+        return await self._shared(
+            (source, target), lambda: self._run(solve_path, source, target)
+        )
+
+    async def _distances(self, source: int) -> bytes:
+        # Target -1 marks the all-distances search in in_flight
+        return await self._shared(
+            (source, -1), lambda: self._run(_distances_response, source)
+        )
+
+    async def _shared(
+        self, key: tuple[int, int], start: Callable[[], Awaitable]
+    ) -> object:
+        # Share a search that is already running for key, or start one
+        search = self.in_flight.get(key)
+        if search is None:
+            search = asyncio.ensure_future(start())
+            self.in_flight[key] = search
+            search.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded so one client hanging up does not cancel the search for everyone else
+        return await asyncio.shield(search)
+
+    async def _run(self, function: Callable[..., object], *args: int) -> object:
+        # Run a worker function once a search slot is free
+        async with self._slots:
+            self.searches += 1
+            loop = asyncio.get_running_loop()
+            executor = self._executor
+            try:
+                return await loop.run_in_executor(executor, function, *args)
+            except BrokenProcessPool:
+                # A worker died (killed or out of memory) and took the pool with it. Every
+                # search on that pool fails, the first to notice starts a new one for the rest.
+                if self._executor is executor:
+                    executor.shutdown(wait=False)
+                    self._start_pool()
+                raise
+
+
+async def load_test(
+    requests: list[dict],
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    path: str | None = None,
+    connections: int = 16,
+) -> dict[str, float]:
+    # Send the requests over several connections at once and measure every round trip.
+    # Returns the request count, the p50 and p99 latency in seconds and requests per second.
+    next_request = iter(requests)
+    latency = LatencyHistogram()
+    errors = 0
+
+    async def client() -> None:
+        nonlocal errors
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for request in next_request:
+                start = time.perf_counter()
+                writer.write(json.dumps(request).encode() + b"\n")
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                latency.record(time.perf_counter() - start)
+                if "error" in response:
+                    errors += 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": latency.count,
+        "errors": errors,
+        "p50": latency.percentile(0.50),
+        "p99": latency.percentile(0.99),
+        "throughput": latency.count / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def query_server() -> None:
+    print("Problem 2: Shortest path query server.")
+    print(
+        "Loads a graph once and answers JSON queries such as "
+        '{"source": "A", "target": "F"}, one per line.'
+    )
+
+    graph_path = input("Enter a graph snapshot (.bin) or edge list file path: ").strip()
+    if not os.path.isfile(graph_path):
+        print(f"File '{graph_path}' does not exist.")
+        return
+
+    try:
+        if graph_path.endswith(".bin"):
+            graph = CSRGraph.load(graph_path)
+        else:
+            graph = CSRGraph.from_edge_list(
+                graph_path, "," if graph_path.endswith(".csv") else None
+            )
+        server = ShortestPathServer(graph)
+    except ValueError as error:
+        print(f"Could not load the graph: {error}")
+        return
+
+    port_input = input(f"Port (press Enter for {DEFAULT_PORT}): ").strip()
+    try:
+        port = int(port_input) if port_input else DEFAULT_PORT
+    except ValueError:
+        print("Invalid port. Please enter a valid integer.")
+        return
+
+    async def run() -> None:
+        await server.start(port=port)
+        print(
+            f"Serving {graph.vertex_count} vertices and {graph.edge_count} edges "
+            f"on 127.0.0.1:{port}, press Ctrl+C to stop."
+        )
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    query_server()
@@ -0,0 +1,249 @@
+from array import array
+from collections import OrderedDict
+
+from tasks.problem_2_dijkstras_algorithm import CSRGraph, MinHeap, ShortestPathTree
+
+# Rough size of one cached tree per vertex: a list slot and a float/int object for the distance
+# plus 8 bytes in the predecessor array
+BYTES_PER_TREE_VERTEX = 48
+
+
+class DynamicGraph:
+    """
+    A mutable graph that counts its versions and tells the caches built on it about every edge change.
+    Edges are kept as one dict per vertex in both directions (out_edges[u][v] and in_edges[v][u]
+    hold the weight of u -> v) so an edge can be looked up, changed and walked backwards in O(1).
+    """
+
+    def __init__(self, graph: dict[str, list[tuple[str, int]]] | CSRGraph) -> None:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+        self.names: list[str] = csr.names
+        self.index: dict[str, int] = csr.index
+
+        self.out_edges: list[dict[int, float]] = [{} for _ in csr.names]
+        self.in_edges: list[dict[int, float]] = [{} for _ in csr.names]
+        for u in range(csr.vertex_count):
+            for e in range(csr.offsets[u], csr.offsets[u + 1]):
+                v = csr.targets[e]
+                weight = csr.weights[e]
+                if weight < 0:
+                    raise ValueError(
+                        f"Negative weight found: {weight} for edge {csr.names[u]} -> {csr.names[v]}."
+                    )
+                # Of parallel edges only the lightest matters, as in a plain Dijkstra
+                if weight < self.out_edges[u].get(v, float("inf")):
+                    self.out_edges[u][v] = weight
+                    self.in_edges[v][u] = weight
+
+        self.version: int = 0
+        self.listeners: list["ShortestPathCache"] = []
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def set_edge_weight(self, source: str, destination: str, weight: float) -> None:
+        # Add the edge source -> destination or change its weight
+        if weight < 0:
+            raise ValueError("Weight must be a non-negative integer.")
+        self._update(source, destination, weight)
+
+    def remove_edge(self, source: str, destination: str) -> None:
+        # Removing an edge is the same as raising its weight to infinity
+        self._update(source, destination, float("inf"))
+
+    def _update(self, source: str, destination: str, weight: float) -> None:
+        if source not in self.index or destination not in self.index:
+            raise ValueError(f"Edge {source} -> {destination} has an unknown vertex.")
+        u = self.index[source]
+        v = self.index[destination]
+        old_weight = self.out_edges[u].get(v, float("inf"))
+        if weight == old_weight:
+            return
+
+        if weight == float("inf"):
+            del self.out_edges[u][v]
+            del self.in_edges[v][u]
+        else:
+            self.out_edges[u][v] = weight
+            self.in_edges[v][u] = weight
+
+        self.version += 1
+        for listener in self.listeners:
+            listener.edge_changed(u, v, old_weight, weight)
+
+
+class ShortestPathCache:
+    """
+    LRU cache of shortest path trees (distance and predecessor of every vertex) per source vertex.
+    Trees are evicted least recently used first once their estimated size passes max_memory bytes.
+    When an edge weight changes, cached trees are repaired instead of thrown away:
+    - a decrease only lowers distances, so a Dijkstra run starting at the edge's head fixes them,
+    - an increase only matters for a tree edge, and then only the subtree below it is recomputed,
+      seeded from the unaffected vertices that have edges into it.
+    SOURCE: https://en.wikipedia.org/wiki/Dynamic_problem_(algorithms)
+    SOURCE: Ramalingam and Reps, "On the computational complexity of dynamic graph problems" (1996)
+    """
+
+    def __init__(
+        self, graph: DynamicGraph, max_memory: int = 256 * 1024 * 1024
+    ) -> None:
+        self.graph = graph
+        self.max_trees = max(
+            1, max_memory // (graph.vertex_count * BYTES_PER_TREE_VERTEX + 1)
+        )
+        self.trees: OrderedDict[int, tuple[list[float], array]] = OrderedDict()
+        # The graph version every cached tree is up to date with
+        self.version = graph.version
+        self.hits = 0
+        self.misses = 0
+        self.repairs = 0
+        graph.listeners.append(self)
+
+    def distances(self, source: str) -> dict[str, float]:
+        distance, _ = self._tree(source)
+        return {name: distance[i] for i, name in enumerate(self.graph.names)}
+
+    def tree(self, source: str) -> ShortestPathTree:
+        # A lazy view of the cached tree, it shares the arrays and is only valid until the next edge change
+        distance, previous = self._tree(source)
+        return ShortestPathTree(
+            self.graph.names,
+            self.graph.index[source],
+            distance,
+            previous,
+            self.graph.index,
+        )
+
+    def get_path(self, source: str, destination: str) -> list[str] | None:
+        if destination not in self.graph:
+            print("Invalid graph or destination vertex does not exist.")
+            return None
+        distance, previous = self._tree(source)
+        target = self.graph.index[destination]
+        if distance[target] == float("inf"):
+            print(f"No path found from {source} to {destination}.")
+            return None
+
+        path: list[str] = []
+        current = target
+        while current != -1:
+            path.append(self.graph.names[current])
+            current = previous[current]
+        path.reverse()
+        return path
+
+    def _tree(self, source: str) -> tuple[list[float], array]:
+        if source not in self.graph:
+            raise ValueError(f"Source vertex '{source}' does not exist in the graph.")
+        if self.version != self.graph.version:
+            # Changed without telling us (should not happen), nothing cached can be trusted
+            self.trees.clear()
+            self.version = self.graph.version
+
+        vertex = self.graph.index[source]
+        if vertex in self.trees:
+            self.hits += 1
+            self.trees.move_to_end(vertex)
+            return self.trees[vertex]
+
+        self.misses += 1
+        tree = self._dijkstra(vertex)
+        self.trees[vertex] = tree
+        while len(self.trees) > self.max_trees:
+            self.trees.popitem(last=False)
+        return tree
+
+    def _dijkstra(self, source: int) -> tuple[list[float], array]:
+        distance: list[float] = [float("inf")] * self.graph.vertex_count
+        previous = array("q", [-1]) * self.graph.vertex_count
+        distance[source] = 0
+        self._propagate(distance, previous, [(0, source)])
+        return distance, previous
+
+    def _propagate(
+        self,
+        distance: list[float],
+        previous: array,
+        seeds: list[tuple[float, int]],
+        allowed: set[int] | None = None,
+    ) -> None:
+        # Dijkstra from the already labelled seed vertices, only lowering distances.
+        # allowed limits which vertices may be improved (the subtree being rebuilt).
+        out_edges = self.graph.out_edges
+        priority_queue = MinHeap()
+        for seed in seeds:
+            priority_queue.insert(seed)
+
+        while not priority_queue.is_empty():
+            current_dist, current = priority_queue.extract_min()
+            if current_dist > distance[current]:
+                continue  # A stale entry
+            for neighbour, weight in out_edges[current].items():
+                if allowed is not None and neighbour not in allowed:
+                    continue
+                new_distance = current_dist + weight
+                if new_distance < distance[neighbour]:
+                    distance[neighbour] = new_distance
+                    previous[neighbour] = current
+                    priority_queue.insert((new_distance, neighbour))
+
+    def edge_changed(
+        self, u: int, v: int, old_weight: float, new_weight: float
+    ) -> None:
+        # Called by the graph after the weight of u -> v changed from old_weight to new_weight
+        for distance, previous in self.trees.values():
+            if new_weight < old_weight:
+                self._repair_decrease(distance, previous, u, v, new_weight)
+            else:
+                self._repair_increase(distance, previous, u, v)
+            self.repairs += 1
+        self.version = self.graph.version
+
+    def _repair_decrease(
+        self, distance: list[float], previous: array, u: int, v: int, weight: float
+    ) -> None:
+        # Only vertices that get closer through the cheaper edge change, all reachable from v
+        if distance[u] + weight < distance[v]:
+            distance[v] = distance[u] + weight
+            previous[v] = u
+            self._propagate(distance, previous, [(distance[v], v)])
+
+    def _repair_increase(
+        self, distance: list[float], previous: array, u: int, v: int
+    ) -> None:
+        # If u -> v is not a tree edge no shortest path used it, so nothing changes
+        if previous[v] != u:
+            return
+
+        # Collect the subtree hanging below v: the vertices whose shortest path used u -> v
+        subtree = {v}
+        stack = [v]
+        while stack:
+            current = stack.pop()
+            for child in self.graph.out_edges[current]:
+                if previous[child] == current and child not in subtree:
+                    subtree.add(child)
+                    stack.append(child)
+
+        for vertex in subtree:
+            distance[vertex] = float("inf")
+            previous[vertex] = -1
+
+        # Give every subtree vertex its best distance through a vertex outside the subtree,
+        # then let Dijkstra settle the rest of the subtree from there
+        seeds: list[tuple[float, int]] = []
+        for vertex in subtree:
+            for parent, weight in self.graph.in_edges[vertex].items():
+                if (
+                    parent not in subtree
+                    and distance[parent] + weight < distance[vertex]
+                ):
+                    distance[vertex] = distance[parent] + weight
+                    previous[vertex] = parent
+            if distance[vertex] != float("inf"):
+                seeds.append((distance[vertex], vertex))
+        self._propagate(distance, previous, seeds, subtree)
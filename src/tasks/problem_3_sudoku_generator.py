@@ -0,0 +1,190 @@
+import random
+
+from tasks.problem_3_sudoku_solver import BitmaskBoard, Sudoku, format_puzzle
+
+# From least to most work for a human solver, see SudokuGenerator.rate
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Full grids tried before generate gives up on a clue count or difficulty it cannot reach
+GENERATE_ATTEMPTS = 100
+
+
+class SudokuGenerator:
+    """
+    Makes puzzles with exactly one solution: fill a random full grid, then take clues away in
+    random order, putting a clue back whenever the puzzle would stop being unique.
+    Removing the clue v from a cell keeps the puzzle unique exactly when no solution puts anything
+    else in that cell, so every check is a search for one solution with v ruled out there, not a
+    count of two. Most removals never get that far: the clue is forced back by the other clues
+    when it is the only candidate of its cell or the only place for v in one of its houses.
+    SOURCE: https://en.wikipedia.org/wiki/Mathematics_of_Sudoku
+    """
+
+    def __init__(self, box_size: int = 3, seed: int | None = None) -> None:
+        if box_size < 1:
+            raise ValueError("Box size must be a positive integer.")
+        self.box_size = box_size
+        self.side = box_size * box_size
+        self.random = random.Random(seed)
+        self.solver = Sudoku("dlx")
+        # Uniqueness checks that needed a search, the rest were settled by singles
+        self.searches = 0
+
+    def full_grid(self) -> list[list[int]]:
+        # A random solved grid. The boxes on the diagonal share no row or column, so each gets an
+        # independent shuffle, and the solver completes the rest.
+        grid = [[0] * self.side for _ in range(self.side)]
+        for band in range(self.box_size):
+            values = self.random.sample(range(1, self.side + 1), self.side)
+            for i, value in enumerate(values):
+                row = band * self.box_size + i // self.box_size
+                col = band * self.box_size + i % self.box_size
+                grid[row][col] = value
+        return self.solver.solve(grid)
+
+    def generate(
+        self, clues: int | None = None, difficulty: str | None = None
+    ) -> tuple[list[list[int]], list[list[int]]]:
+        # A (puzzle, solution) pair with a unique solution. clues stops removing at that many
+        # clues (None removes as many as possible) and difficulty keeps only puzzles that rate so.
+        # Raises ValueError when GENERATE_ATTEMPTS full grids do not give such a puzzle.
+        if clues is not None and not 0 <= clues <= self.side * self.side:
+            raise ValueError(f"Clue count must be between 0 and {self.side ** 2}.")
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+
+        for _ in range(GENERATE_ATTEMPTS):
+            solution = self.full_grid()
+            puzzle = self._remove_clues(solution, clues, difficulty)
+            if puzzle is None:
+                continue
+            if difficulty is not None and self.rate(puzzle) != difficulty:
+                continue
+            return puzzle, solution
+
+        raise ValueError(
+            f"No puzzle with {clues if clues is not None else 'minimal'} clues and "
+            f"{difficulty or 'any'} difficulty found in {GENERATE_ATTEMPTS} attempts."
+        )
+
+    def rate(self, puzzle: list[list[int]]) -> str:
+        # "easy" if naked singles (cells with one candidate) alone solve it, "medium" if naked and
+        # hidden singles do, "hard" if it takes guessing
+        board = BitmaskBoard([row[:] for row in puzzle])
+        if self._naked_singles(board):
+            return "easy"
+        rater = Sudoku("propagate")
+        rater.solve(puzzle)
+        return "medium" if rater.nodes == 1 else "hard"
+
+    def _remove_clues(
+        self,
+        solution: list[list[int]],
+        clues: int | None,
+        difficulty: str | None,
+    ) -> list[list[int]] | None:
+        # Take clues away from a full grid while the puzzle stays unique (and no harder than
+        # difficulty). None if it ends with more than clues clues.
+        puzzle = [row[:] for row in solution]
+        board = BitmaskBoard(puzzle)
+        cells = [
+            (row, col, board.box_of[row][col])
+            for row in range(self.side)
+            for col in range(self.side)
+        ]
+        self.random.shuffle(cells)
+        ceiling = None
+        if difficulty is not None and difficulty != DIFFICULTIES[-1]:
+            ceiling = DIFFICULTIES.index(difficulty)
+
+        remaining = len(cells)
+        for row, col, box in cells:
+            if clues is not None and remaining <= clues:
+                break
+            bit = 1 << (puzzle[row][col] - 1)
+            board.unplace(row, col, box, bit)
+            board.empty.append((row, col, box))
+
+            keep = self._still_unique(board, row, col, box, bit) and (
+                ceiling is None or DIFFICULTIES.index(self.rate(puzzle)) <= ceiling
+            )
+            if keep:
+                remaining -= 1
+            else:
+                board.empty.pop()
+                board.place(row, col, box, bit)
+
+        if clues is not None and remaining > clues:
+            return None
+        return puzzle
+
+    def _still_unique(
+        self, board: BitmaskBoard, row: int, col: int, box: int, bit: int
+    ) -> bool:
+        # The puzzle was unique with bit at (row, col), is it still unique with the cell empty?
+        if board.candidates(row, col, box) == bit:
+            return True  # Naked single, nothing else fits the cell
+
+        # Hidden single, no other empty cell of the row, column or box can take bit
+        for unit in (
+            board.units[row],
+            board.units[self.side + col],
+            board.units[2 * self.side + box],
+        ):
+            for other_row, other_col, other_box in unit:
+                if (
+                    board.grid[other_row][other_col] == 0
+                    and (other_row, other_col) != (row, col)
+                    and board.candidates(other_row, other_col, other_box) & bit
+                ):
+                    break
+            else:
+                return True
+
+        # Look for a solution with anything but bit in the cell
+        self.searches += 1
+        links, _ = self.solver._exact_cover(board, (row, col, box, bit))
+        return self.solver._search_dlx(links, [], 1) == 0
+
+    def _naked_singles(self, board: BitmaskBoard) -> bool:
+        # Fill cells with a single candidate until none is left, True if that solves the board
+        changed = True
+        while changed:
+            changed = False
+            for row, col, box in board.empty:
+                if board.grid[row][col] == 0:
+                    free = board.candidates(row, col, box)
+                    if free and free & (free - 1) == 0:
+                        board.place(row, col, box, free)
+                        changed = True
+        return all(board.grid[row][col] for row, col, _ in board.empty)
+
+
+def generate_puzzles() -> None:
+    print("Problem 3: Sudoku puzzle generator.")
+
+    try:
+        count = int(input("How many puzzles: "))
+        clue_input = input("Clues per puzzle (press Enter for as few as possible): ")
+        clues = int(clue_input) if clue_input.strip() else None
+    except ValueError:
+        print("Invalid input. Please enter a valid integer.")
+        return
+    difficulty = (
+        input(f"Difficulty, {', '.join(DIFFICULTIES)} (press Enter for any): ")
+        .strip()
+        .lower()
+        or None
+    )
+
+    generator = SudokuGenerator()
+    try:
+        for _ in range(count):
+            puzzle, solution = generator.generate(clues, difficulty)
+            print(f"{format_puzzle(puzzle)},{format_puzzle(solution)}")
+    except ValueError as error:
+        print(error)
+
+
+if __name__ == "__main__":
+    generate_puzzles()